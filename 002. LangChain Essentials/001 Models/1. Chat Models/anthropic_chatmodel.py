@@ -1,9 +1,10 @@
 from langchain_anthropic import ChatAnthropic
 from dotenv import load_dotenv
+from cached_chat_model import CachedChatModel
 
 load_dotenv()
 
-model = ChatAnthropic(model="claude-3.5-sonnet-20241022")
+model = CachedChatModel(ChatAnthropic(model="claude-3.5-sonnet-20241022"))
 
 result = model.invoke("What is the capital city of Pakistan?")
 
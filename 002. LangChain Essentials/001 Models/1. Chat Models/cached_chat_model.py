@@ -0,0 +1,254 @@
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future
+
+import numpy as np
+from langchain_core.messages import HumanMessage, message_to_dict, messages_from_dict
+from langchain_core.runnables import Runnable, RunnableBinding
+
+
+def _to_messages(input):
+    if isinstance(input, str):
+        return [HumanMessage(content=input)]
+    if hasattr(input, "to_messages"):
+        return input.to_messages()
+    return list(input)
+
+
+def _model_key(model):
+    bound = {}
+    while isinstance(model, RunnableBinding):
+        bound = {**model.kwargs, **bound}
+        model = model.bound
+
+    params = getattr(model, "_identifying_params", {}) or {}
+    return json.dumps({"type": type(model).__name__, **params, "bound": bound}, sort_keys=True, default=str)
+
+
+class CachedChatModel(Runnable):
+    """Caching wrapper for any chat model.
+
+    Identical concurrent requests are coalesced into one in-flight call
+    (single-flight), and responses are kept in a persistent SQLite cache keyed
+    on (model, params, call kwargs, messages hash). Params include kwargs
+    bound with `.bind(...)`, and call kwargs cover stop, max_tokens, tools
+    and the like, so the same messages with different settings are cached
+    separately. If `embeddings` is given, misses fall back to a semantic
+    cache that returns the response of the nearest cached prompt with the
+    same settings whose cosine similarity is at least `similarity_threshold`.
+
+    Decoded responses are kept in an in-memory LRU of `memory_size` entries in
+    front of SQLite. `ainvoke` runs cache reads and writes (SQLite and
+    `embed_query`) in a worker thread so they don't block the event loop.
+    """
+
+    def __init__(self, model, path="chat_cache.sqlite", embeddings=None, similarity_threshold=0.95,
+                 memory_size=1024):
+        self.model = model
+        self.embeddings = embeddings
+        self.similarity_threshold = similarity_threshold
+        self.memory_size = memory_size
+
+        self.model_key = _model_key(model)
+
+        self.db = sqlite3.connect(path, check_same_thread=False)
+        self.db.execute("CREATE TABLE IF NOT EXISTS responses (key TEXT PRIMARY KEY, message TEXT)")
+        self.db.execute("CREATE TABLE IF NOT EXISTS semantic (key TEXT PRIMARY KEY, model TEXT, vector BLOB)")
+        self.db.commit()
+
+        self.memory = OrderedDict()
+        self.lock = threading.Lock()
+        self.in_flight = {}
+        self.async_in_flight = {}
+        self.stats = {"exact_hits": 0, "semantic_hits": 0, "coalesced": 0, "misses": 0}
+
+        self.semantic = {}
+        if embeddings is not None:
+            self._load_semantic()
+
+    def _scope(self, kwargs):
+        if not kwargs:
+            return self.model_key
+        return self.model_key + "\n" + json.dumps(kwargs, sort_keys=True, default=str)
+
+    def _key(self, messages, scope):
+        payload = json.dumps([message_to_dict(m) for m in messages], sort_keys=True, default=str)
+        return hashlib.sha256((scope + payload).encode("utf-8")).hexdigest()
+
+    def _load_semantic(self):
+        rows = self.db.execute(
+            "SELECT key, model, vector FROM semantic WHERE substr(model, 1, ?) = ?",
+            (len(self.model_key), self.model_key),
+        ).fetchall()
+
+        grouped = {}
+        for key, scope, vector in rows:
+            if scope == self.model_key or scope.startswith(self.model_key + "\n"):
+                grouped.setdefault(scope, []).append((key, np.frombuffer(vector, dtype=np.float32)))
+        for scope, entries in grouped.items():
+            self.semantic[scope] = ([key for key, _ in entries], np.stack([vector for _, vector in entries]))
+
+    def _remember(self, key, message):
+        # Caller holds self.lock.
+        self.memory[key] = message
+        self.memory.move_to_end(key)
+        while len(self.memory) > self.memory_size:
+            self.memory.popitem(last=False)
+
+    def _prompt_vector(self, messages):
+        text = "\n".join(f"{m.type}: {m.content}" for m in messages)
+        vector = np.asarray(self.embeddings.embed_query(text), dtype=np.float32)
+        return vector / (np.linalg.norm(vector) or 1.0)
+
+    def _lookup(self, key):
+        with self.lock:
+            if key in self.memory:
+                self.memory.move_to_end(key)
+                return self.memory[key]
+
+        row = self.db.execute("SELECT message FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+
+        message = messages_from_dict([json.loads(row[0])])[0]
+        with self.lock:
+            self._remember(key, message)
+        return message
+
+    def _semantic_lookup(self, vector, scope):
+        if scope not in self.semantic:
+            return None
+
+        keys, vectors = self.semantic[scope]
+        # `vectors` may have spare capacity past the stored rows.
+        scores = vectors[:len(keys)] @ vector
+        best = int(np.argmax(scores))
+        if scores[best] < self.similarity_threshold:
+            return None
+        return self._lookup(keys[best])
+
+    def _store(self, key, message, vector=None, scope=None):
+        with self.lock:
+            self._remember(key, message)
+            self.db.execute(
+                "INSERT OR REPLACE INTO responses (key, message) VALUES (?, ?)",
+                (key, json.dumps(message_to_dict(message))),
+            )
+            if vector is not None:
+                self.db.execute(
+                    "INSERT OR REPLACE INTO semantic (key, model, vector) VALUES (?, ?, ?)",
+                    (key, scope, vector.tobytes()),
+                )
+                keys, vectors = self.semantic.get(scope, ([], np.empty((0, len(vector)), dtype=np.float32)))
+                if len(keys) == len(vectors):
+                    # Grow geometrically so inserts are amortised O(1) rather than a full copy each.
+                    grown = np.empty((max(16, 2 * len(vectors)), len(vector)), dtype=np.float32)
+                    grown[:len(keys)] = vectors[:len(keys)]
+                    vectors = grown
+                vectors[len(keys)] = vector
+                keys.append(key)
+                self.semantic[scope] = (keys, vectors)
+            self.db.commit()
+
+    def _cached(self, key, messages, scope):
+        message = self._lookup(key)
+        if message is not None:
+            self.stats["exact_hits"] += 1
+            return message, None
+
+        if self.embeddings is None:
+            return None, None
+
+        vector = self._prompt_vector(messages)
+        message = self._semantic_lookup(vector, scope)
+        if message is not None:
+            self.stats["semantic_hits"] += 1
+        return message, vector
+
+    def invoke(self, input, config=None, **kwargs):
+        messages = _to_messages(input)
+        scope = self._scope(kwargs)
+        key = self._key(messages, scope)
+
+        message, vector = self._cached(key, messages, scope)
+        if message is not None:
+            return message
+
+        with self.lock:
+            # A leader that finished after the lookup above has already
+            # stored its response and left `in_flight`.
+            message = self.memory.get(key)
+            if message is not None:
+                self.memory.move_to_end(key)
+                self.stats["exact_hits"] += 1
+                return message
+
+            future = self.in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = self.in_flight[key] = Future()
+
+        if not leader:
+            self.stats["coalesced"] += 1
+            return future.result()
+
+        try:
+            self.stats["misses"] += 1
+            message = self.model.invoke(messages, config, **kwargs)
+            self._store(key, message, vector, scope)
+            future.set_result(message)
+            return message
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        finally:
+            with self.lock:
+                del self.in_flight[key]
+
+    async def ainvoke(self, input, config=None, **kwargs):
+        messages = _to_messages(input)
+        scope = self._scope(kwargs)
+        key = self._key(messages, scope)
+
+        message, vector = await asyncio.to_thread(self._cached, key, messages, scope)
+        if message is not None:
+            return message
+
+        with self.lock:
+            # A leader may have finished while the lookup ran in the worker thread.
+            message = self.memory.get(key)
+        if message is not None:
+            self.stats["exact_hits"] += 1
+            return message
+
+        future = self.async_in_flight.get(key)
+        if future is not None:
+            self.stats["coalesced"] += 1
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+            # The leader was cancelled; retry rather than fail this caller.
+            return await self.ainvoke(input, config, **kwargs)
+
+        future = self.async_in_flight[key] = asyncio.get_running_loop().create_future()
+        try:
+            self.stats["misses"] += 1
+            message = await self.model.ainvoke(messages, config, **kwargs)
+            await asyncio.to_thread(self._store, key, message, vector, scope)
+            future.set_result(message)
+            return message
+        except Exception as error:
+            future.set_exception(error)
+            future.exception()
+            raise
+        finally:
+            # Cancellation (or any other BaseException) must still release followers.
+            if not future.done():
+                future.cancel()
+            del self.async_in_flight[key]
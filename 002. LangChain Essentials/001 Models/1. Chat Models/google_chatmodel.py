@@ -1,9 +1,10 @@
 from langchain_google_genai import ChatGoogleGenerativeAI
 from dotenv import load_dotenv
+from cached_chat_model import CachedChatModel
 
 load_dotenv()
 
-model = ChatGoogleGenerativeAI(model="gemini-1.5-pro")
+model = CachedChatModel(ChatGoogleGenerativeAI(model="gemini-1.5-pro"))
 
 result = model.invoke("What is the capital city of Pakistan?")
 
@@ -1,5 +1,6 @@
 from langchain_huggingface import ChatHuggingFace, HuggingFaceEndpoint
 from dotenv import load_dotenv
+from cached_chat_model import CachedChatModel
 
 load_dotenv()
 
@@ -8,7 +9,7 @@ llm = HuggingFaceEndpoint(
     task="text-generation",
 )
 
-model = ChatHuggingFace(llm=llm)
+model = CachedChatModel(ChatHuggingFace(llm=llm))
 
 result = model.invoke("What is the capital of Pakistan?")
 
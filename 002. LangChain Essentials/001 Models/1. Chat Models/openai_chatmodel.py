@@ -1,9 +1,10 @@
 from langchain_openai import ChatOpenAI
 from dotenv import load_dotenv
+from cached_chat_model import CachedChatModel
 
 load_dotenv()
 
-model = ChatOpenAI(model="gpt-4")
+model = CachedChatModel(ChatOpenAI(model="gpt-4"))
 
 result = model.invoke("What is the capital city of Pakistan?")
 
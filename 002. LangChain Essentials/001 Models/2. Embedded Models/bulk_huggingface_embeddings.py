@@ -0,0 +1,132 @@
+import os
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+_model = None
+
+
+def _init_worker(model_name, threads_per_worker):
+    global _model
+
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    torch.set_num_threads(threads_per_worker)
+    _model = SentenceTransformer(model_name, device="cpu")
+
+
+def _encode_bucket(indices, texts, batch_size, normalize_embeddings):
+    vectors = _model.encode(
+        texts,
+        batch_size=batch_size,
+        normalize_embeddings=normalize_embeddings,
+        convert_to_numpy=True,
+        show_progress_bar=False,
+    )
+    return indices, vectors.astype(np.float32)
+
+
+def length_buckets(texts, bucket_size):
+    order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+    return [order[start:start + bucket_size] for start in range(0, len(order), bucket_size)]
+
+
+class BulkHuggingFaceEmbeddings(Embeddings):
+    """Bulk CPU encoder for sentence-transformers models.
+
+    Texts are sorted by length into buckets so every batch pads to a similar
+    length, and buckets are sharded across a process pool that loads the model
+    once per worker. The pool is started on the first `encode` and reused by
+    later calls; shut it down with `close()` or use the encoder as a context
+    manager. Vectors are returned in the original input order.
+    """
+
+    def __init__(self, model_name="sentence-transformers/all-MiniLM-L6-v2", num_workers=None,
+                 bucket_size=2048, batch_size=64, normalize_embeddings=False):
+        self.model_name = model_name
+        self.num_workers = num_workers or os.cpu_count()
+        self.bucket_size = bucket_size
+        self.batch_size = batch_size
+        self.normalize_embeddings = normalize_embeddings
+        self._query_model = None
+        self._pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def _get_pool(self):
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.num_workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self.model_name, max(1, os.cpu_count() // self.num_workers)),
+            )
+        return self._pool
+
+    def encode(self, texts):
+        texts = list(texts)
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+
+        pool = self._get_pool()
+        results = None
+
+        try:
+            futures = [
+                pool.submit(_encode_bucket, bucket, [texts[i] for i in bucket], self.batch_size, self.normalize_embeddings)
+                for bucket in length_buckets(texts, self.bucket_size)
+            ]
+
+            for future in as_completed(futures):
+                indices, vectors = future.result()
+                if results is None:
+                    results = np.empty((len(texts), vectors.shape[1]), dtype=np.float32)
+                results[indices] = vectors
+        except BrokenProcessPool:
+            # A crashed worker breaks the pool for good; start a fresh one next call.
+            self.close()
+            raise
+
+        return results
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown(wait=True, cancel_futures=True)
+            self._pool = None
+
+    def embed_documents(self, texts):
+        return self.encode(texts).tolist()
+
+    def embed_query(self, text):
+        if self._query_model is None:
+            from sentence_transformers import SentenceTransformer
+            self._query_model = SentenceTransformer(self.model_name, device="cpu")
+
+        vector = self._query_model.encode(text, normalize_embeddings=self.normalize_embeddings)
+        return vector.tolist()
+
+
+if __name__ == "__main__":
+    docs = [
+        "Islamabad is the capital city of Pakistan.",
+        "Karachi is the largest city in Pakistan.",
+        "Pakistan is a country in South Asia.",
+        "Pakistan has a population of over 220 million people.",
+        "Pakistan has a diverse culture."
+    ]
+
+    with BulkHuggingFaceEmbeddings(num_workers=2, bucket_size=2) as embeddings:
+        result = embeddings.encode(docs)
+        print(result.shape)
+
+        # The second call reuses the same workers and their loaded model.
+        result = embeddings.encode(docs[::-1])
+        print(result.shape)
@@ -0,0 +1,210 @@
+import hashlib
+import json
+import os
+import re
+from collections import OrderedDict
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+
+
+class CachedEmbeddings(Embeddings):
+    """Wraps any embeddings object with a persistent, content-addressed vector cache.
+
+    Each (model name, dimensions) pair gets its own store under `cache_dir`:
+    a memory-mapped float32 file plus an append-only JSONL index keyed on the
+    text hash. Only cache misses are sent to the wrapped `embed_documents`,
+    and the index is only appended to when something was added, so a call
+    that is all hits writes nothing. The least recently used entries are
+    evicted once `max_entries` is exceeded, and evictions are synced to the
+    log before their slots are reused; the log is compacted when it grows
+    well past the number of live entries.
+    """
+
+    def __init__(self, embeddings, cache_dir="embedding_cache", max_entries=100_000):
+        self.embeddings = embeddings
+        self.max_entries = max_entries
+
+        self.model_name = getattr(embeddings, "model", None) or getattr(embeddings, "model_name", "")
+        self.dimensions = getattr(embeddings, "dimensions", None)
+
+        store_name = re.sub(r"[^\w.-]+", "_", f"{self.model_name or type(embeddings).__name__}-{self.dimensions}")
+        self.cache_dir = os.path.join(cache_dir, store_name)
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.index_path = os.path.join(self.cache_dir, "index.jsonl")
+        self.vectors_path = os.path.join(self.cache_dir, "vectors.f32")
+
+        self.index = OrderedDict()
+        self.free_slots = []
+        self.dim = None
+        self.capacity = 0
+        self.vectors = None
+        self.log_records = 0
+        self.pending = []
+        self.touched = {}
+        self._load()
+
+    def _key(self, text):
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{self.model_name}:{self.dimensions}:{digest}"
+
+    def _load(self):
+        if not os.path.exists(self.index_path):
+            return
+
+        with open(self.index_path, "rb+") as f:
+            data = f.read()
+            # Cut a torn final append from an interrupted run so new records
+            # start on a fresh line.
+            end = data.rfind(b"\n") + 1
+            if end < len(data):
+                f.truncate(end)
+
+        for line in data[:end].splitlines():
+            try:
+                op, *args = json.loads(line)
+            except ValueError:
+                continue
+
+            if op == "meta":
+                self.dim, self.capacity = args
+            elif op == "put":
+                self.index[args[0]] = args[1]
+                self.index.move_to_end(args[0])
+            elif op == "touch" and args[0] in self.index:
+                self.index.move_to_end(args[0])
+            elif op == "del":
+                self.index.pop(args[0], None)
+            self.log_records += 1
+
+        used = set(self.index.values())
+        self.free_slots = [slot for slot in range(self.capacity - 1, -1, -1) if slot not in used]
+
+        if self.dim and self.capacity:
+            self.vectors = np.memmap(self.vectors_path, dtype=np.float32, mode="r+", shape=(self.capacity, self.dim))
+
+    def _save(self, sync=False):
+        if not self.pending:
+            return
+
+        if self.vectors is not None:
+            self.vectors.flush()
+
+        records = [["touch", key] for key in self.touched] + self.pending
+        if self.log_records + len(records) > 2 * len(self.index) + 1024:
+            self._compact()
+        else:
+            with open(self.index_path, "a") as f:
+                f.writelines(json.dumps(record) + "\n" for record in records)
+                if sync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            self.log_records += len(records)
+
+        self.pending = []
+        self.touched = {}
+
+    def _compact(self):
+        records = [["meta", self.dim, self.capacity]] + [["put", key, slot] for key, slot in self.index.items()]
+
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w") as f:
+            f.writelines(json.dumps(record) + "\n" for record in records)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.index_path)
+        self.log_records = len(records)
+
+    def _grow(self, needed):
+        new_capacity = max(needed, self.capacity * 2, 1024)
+        new_capacity = min(new_capacity, max(self.max_entries, needed))
+
+        if self.vectors is not None:
+            self.vectors.flush()
+            del self.vectors
+
+        with open(self.vectors_path, "ab") as f:
+            f.truncate(new_capacity * self.dim * 4)
+
+        self.free_slots.extend(range(self.capacity, new_capacity))
+        self.capacity = new_capacity
+        self.vectors = np.memmap(self.vectors_path, dtype=np.float32, mode="r+", shape=(self.capacity, self.dim))
+        self.pending.append(["meta", self.dim, self.capacity])
+
+    def _evict(self, count):
+        for _ in range(min(count, len(self.index))):
+            key, slot = self.index.popitem(last=False)
+            self.free_slots.append(slot)
+            self.touched.pop(key, None)
+            self.pending.append(["del", key])
+
+    def _store(self, keys, vectors):
+        vectors = np.asarray(vectors, dtype=np.float32)
+
+        if self.dim is None:
+            self.dim = vectors.shape[1]
+        elif vectors.shape[1] != self.dim:
+            raise ValueError(
+                f"{self.model_name} returned {vectors.shape[1]}-dim vectors, "
+                f"but the cache in {self.cache_dir} holds {self.dim}-dim vectors."
+            )
+
+        overflow = len(self.index) + len(keys) - self.max_entries
+        if overflow > 0:
+            self._evict(overflow)
+            # The evicted keys must be gone from the log before their slots
+            # are overwritten, or a crash would map them to the new vectors.
+            self._save(sync=True)
+
+        if len(self.free_slots) < len(keys):
+            self._grow(self.capacity + len(keys) - len(self.free_slots))
+
+        for key, vector in zip(keys, vectors):
+            slot = self.free_slots.pop()
+            self.vectors[slot] = vector
+            self.index[key] = slot
+            self.pending.append(["put", key, slot])
+
+    def embed_documents(self, texts):
+        keys = [self._key(text) for text in texts]
+        results = [None] * len(texts)
+
+        misses = {}
+        for i, key in enumerate(keys):
+            slot = self.index.get(key)
+            if slot is None:
+                misses.setdefault(key, []).append(i)
+            else:
+                self.index.move_to_end(key)
+                self.touched[key] = None
+                results[i] = self.vectors[slot].tolist()
+
+        if misses:
+            miss_keys = list(misses)
+            miss_texts = [texts[misses[key][0]] for key in miss_keys]
+            new_vectors = self.embeddings.embed_documents(miss_texts)
+
+            for key, vector in zip(miss_keys, new_vectors):
+                for i in misses[key]:
+                    results[i] = list(vector)
+
+            self._store(miss_keys, new_vectors)
+
+        self._save()
+
+        return results
+
+    def embed_query(self, text):
+        key = "query:" + self._key(text)
+        slot = self.index.get(key)
+
+        if slot is not None:
+            self.index.move_to_end(key)
+            self.touched[key] = None
+            return self.vectors[slot].tolist()
+
+        vector = self.embeddings.embed_query(text)
+        self._store([key], [vector])
+        self._save()
+
+        return list(vector)
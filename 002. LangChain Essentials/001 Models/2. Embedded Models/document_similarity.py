@@ -1,11 +1,11 @@
 from langchain_openai import OpenAIEmbeddings
 from dotenv import load_dotenv
-from sklearn.metrics.pairwise import cosine_similarity
-import numpy as np
+from cached_embeddings import CachedEmbeddings
+from similarity_search import SimilarityIndex
 
 load_dotenv()
 
-embeddings = OpenAIEmbeddings(model="text-embedding-3-large", dimensions=300)
+embeddings = CachedEmbeddings(OpenAIEmbeddings(model="text-embedding-3-large", dimensions=300))
 
 docs = [
     "Islamabad is the capital city of Pakistan.",
@@ -20,8 +20,9 @@ query = "Tell me what is the largest city of Pakistan."
 doc_embeddings = embeddings.embed_documents(docs)
 query_embedding = embeddings.embed_query(query)
 
-similarity = cosine_similarity([query_embedding], doc_embeddings)[0]
-index, score = sorted(list(enumerate(similarity)), key=lambda x: x[1])[-1]
+similarity_index = SimilarityIndex(doc_embeddings)
+indices, scores = similarity_index.search([query_embedding], k=1)
+index, score = indices[0][0], scores[0][0]
 
 print(docs[index])
 print(f"Similairty score: {score}")
\ No newline at end of file
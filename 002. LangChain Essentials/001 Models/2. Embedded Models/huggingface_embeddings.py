@@ -1,9 +1,10 @@
 from langchain_huggingface import HuggingFaceEmbeddings
 from dotenv import load_dotenv
+from cached_embeddings import CachedEmbeddings
 
 load_dotenv()
 
-embeddings = HuggingFaceEmbeddings(model_name="sentence-transformers/all-MiniLM-L6-v2")
+embeddings = CachedEmbeddings(HuggingFaceEmbeddings(model_name="sentence-transformers/all-MiniLM-L6-v2"))
 
 text = "What is the capital city of Pakistan?"
 
@@ -1,9 +1,10 @@
 from langchain_openai import OpenAIEmbeddings
 from dotenv import load_dotenv
+from cached_embeddings import CachedEmbeddings
 
 load_dotenv()
 
-embeddings = OpenAIEmbeddings(model="text-embedding-3-large", dimensions=32)
+embeddings = CachedEmbeddings(OpenAIEmbeddings(model="text-embedding-3-large", dimensions=32))
 
 result = embeddings.embed_query("What is the capital city of Pakistan?")
 
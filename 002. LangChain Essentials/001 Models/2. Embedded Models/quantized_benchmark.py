@@ -0,0 +1,46 @@
+import time
+
+import numpy as np
+
+from quantized_store import QuantizedEmbeddingStore
+from similarity_search import SimilarityIndex
+
+DIMENSIONS = 300
+CORPUS_SIZE = 200_000
+NUM_QUERIES = 64
+K = 10
+
+rng = np.random.default_rng(0)
+
+centers = rng.standard_normal((256, DIMENSIONS), dtype=np.float32)
+isotropic = centers[rng.integers(0, len(centers), CORPUS_SIZE)] + 0.5 * rng.standard_normal((CORPUS_SIZE, DIMENSIONS), dtype=np.float32)
+
+# Real embeddings have a few high-variance dimensions and many quiet ones,
+# which is where a per-dimension int8 scale matters.
+anisotropic = isotropic * np.exp(rng.uniform(-2.5, 1.0, DIMENSIONS)).astype(np.float32)
+anisotropic[:, :4] += 20 * rng.standard_normal((CORPUS_SIZE, 4), dtype=np.float32)
+
+for name, docs in [("isotropic", isotropic), ("anisotropic", anisotropic)]:
+    queries = docs[rng.integers(0, CORPUS_SIZE, NUM_QUERIES)] + 0.1 * docs.std(axis=0) * rng.standard_normal((NUM_QUERIES, DIMENSIONS), dtype=np.float32)
+
+    exact_index = SimilarityIndex(docs)
+
+    start = time.perf_counter()
+    exact, _ = exact_index.search(queries, k=K)
+    exact_time = time.perf_counter() - start
+
+    print(f"{name} data")
+    print(f"float32 | {exact_index.doc_matrix.nbytes / 2**20:8.1f} MiB in RAM | search: {exact_time:6.3f}s")
+
+    for mode, rescore_factor in [("int8", 1), ("int8", 4), ("binary", 4), ("binary", 10)]:
+        store = QuantizedEmbeddingStore(docs, mode=mode, rescore_factor=rescore_factor)
+
+        start = time.perf_counter()
+        found, _ = store.search(queries, k=K)
+        elapsed = time.perf_counter() - start
+
+        recall = np.mean([len(set(a) & set(b)) / K for a, b in zip(exact, found)])
+
+        print(f"{mode:>7} x{rescore_factor:<2} | {store.nbytes() / 2**20:8.1f} MiB in RAM | search: {elapsed:6.3f}s | recall@{K}: {recall:.3f}")
+
+        store.close()
\ No newline at end of file
@@ -0,0 +1,105 @@
+import os
+import tempfile
+
+import numpy as np
+
+from similarity_search import blocked_top_k, normalize
+
+
+class QuantizedEmbeddingStore:
+    """Embedding store that keeps int8 or 1-bit codes in RAM and full vectors on disk.
+
+    Search runs a coarse pass over the compact codes, then rescores a
+    shortlist of `rescore_factor * k` candidates exactly against the float32
+    vectors in a memory-mapped file. The int8 pass is asymmetric: the float
+    query is scored against the dequantized codes, so only the documents
+    carry quantization error. The binary pass compares sign bits (Hamming
+    distance). Each block of codes only keeps its own shortlist candidates,
+    as in SimilarityIndex. With no `path`, vectors go to a temporary file
+    that `close` removes; a caller-supplied `path` is kept on close, and an
+    existing one is only replaced with `overwrite=True`.
+    """
+
+    def __init__(self, doc_embeddings, path=None, mode="int8", rescore_factor=4, overwrite=False):
+        if mode not in ("int8", "binary"):
+            raise ValueError("mode must be 'int8' or 'binary'.")
+        self.owns_path = path is None
+        if path is None:
+            handle, path = tempfile.mkstemp(prefix="quantized_vectors_", suffix=".f32")
+            os.close(handle)
+        elif os.path.exists(path) and not overwrite:
+            raise FileExistsError(f"{path} already exists; pass overwrite=True to replace it.")
+
+        self.mode = mode
+        self.rescore_factor = rescore_factor
+
+        vectors = normalize(doc_embeddings)
+        self.size, self.dim = vectors.shape
+
+        full = np.memmap(path, dtype=np.float32, mode="w+", shape=vectors.shape)
+        full[:] = vectors
+        full.flush()
+        del full
+        self.vectors = np.memmap(path, dtype=np.float32, mode="r", shape=vectors.shape)
+
+        if mode == "int8":
+            self.scale = np.abs(vectors).max(axis=0)
+            self.scale[self.scale == 0] = 1.0
+            self.codes = self._quantize_int8(vectors)
+        else:
+            self.codes = np.packbits(vectors > 0, axis=1)
+
+    @classmethod
+    def from_texts(cls, texts, embeddings, **kwargs):
+        return cls(embeddings.embed_documents(texts), **kwargs)
+
+    def _quantize_int8(self, vectors):
+        return np.clip(np.rint(vectors / self.scale * 127), -127, 127).astype(np.int8)
+
+    def nbytes(self):
+        return self.codes.nbytes
+
+    def _coarse_search(self, queries, shortlist_size, block_size=16_384):
+        if self.mode == "int8":
+            # codes * scale / 127 approximates the documents, so scaling the
+            # float query by `scale` gives the dot product up to a constant.
+            query_codes = queries * self.scale
+        else:
+            query_codes = np.where(queries > 0, 1.0, -1.0).astype(np.float32)
+
+        def score_block(start, stop):
+            block = self.codes[start:stop]
+            if self.mode == "int8":
+                block = block.astype(np.float32)
+            else:
+                # For +-1 sign vectors, dot product = dim - 2 * Hamming distance.
+                block = np.unpackbits(block, axis=1, count=self.dim).astype(np.float32) * 2 - 1
+            return query_codes @ block.T
+
+        best_indices, _ = blocked_top_k(queries, self.size, shortlist_size, score_block, block_size)
+        return best_indices
+
+    def search(self, query_embeddings, k=4):
+        queries = normalize(query_embeddings)
+        k = min(k, self.size)
+        shortlist_size = min(k * self.rescore_factor, self.size)
+
+        shortlist = self._coarse_search(queries, shortlist_size)
+
+        indices = np.empty((len(queries), k), dtype=np.int64)
+        scores = np.empty((len(queries), k), dtype=np.float32)
+
+        for row, (query, candidates) in enumerate(zip(queries, shortlist)):
+            candidates = np.sort(candidates)
+            exact = self.vectors[candidates] @ query
+            top = np.argsort(-exact)[:k]
+            indices[row] = candidates[top]
+            scores[row] = exact[top]
+
+        return indices, scores
+
+    def close(self):
+        path = self.vectors.filename
+        del self.vectors
+        if self.owns_path and path and os.path.exists(path):
+            os.remove(path)
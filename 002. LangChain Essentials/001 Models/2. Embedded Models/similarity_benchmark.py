@@ -0,0 +1,43 @@
+import time
+
+import numpy as np
+from sklearn.metrics.pairwise import cosine_similarity
+
+from similarity_search import SimilarityIndex
+
+DIMENSIONS = 300
+NUM_QUERIES = 32
+CORPUS_SIZES = [1_000, 100_000, 1_000_000]
+
+rng = np.random.default_rng(0)
+
+
+def sort_everything(queries, docs):
+    results = []
+    for query in queries:
+        similarity = cosine_similarity([query], docs)[0]
+        index, score = sorted(list(enumerate(similarity)), key=lambda x: x[1])[-1]
+        results.append(index)
+    return results
+
+
+for size in CORPUS_SIZES:
+    docs = rng.standard_normal((size, DIMENSIONS), dtype=np.float32)
+    queries = rng.standard_normal((NUM_QUERIES, DIMENSIONS), dtype=np.float32)
+
+    start = time.perf_counter()
+    expected = sort_everything(queries, docs)
+    baseline = time.perf_counter() - start
+
+    start = time.perf_counter()
+    index = SimilarityIndex(docs)
+    build = time.perf_counter() - start
+
+    start = time.perf_counter()
+    indices, scores = index.search(queries, k=1)
+    search = time.perf_counter() - start
+
+    agreement = np.mean(indices[:, 0] == np.array(expected))
+
+    print(f"{size:>9} docs | sorted: {baseline:8.3f}s | index build: {build:6.3f}s | "
+          f"top-k search: {search:6.3f}s | speedup: {baseline / search:6.1f}x | agreement: {agreement:.0%}")
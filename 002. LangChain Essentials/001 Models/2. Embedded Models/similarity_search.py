@@ -0,0 +1,74 @@
+import numpy as np
+
+
+def normalize(matrix):
+    matrix = np.asarray(matrix, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix[None, :]
+
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+
+    return matrix / norms
+
+
+def blocked_top_k(queries, num_docs, k, score_block, block_size):
+    """Return unsorted (indices, scores) of the top `k` documents per query.
+
+    `score_block(start, stop)` scores every query against documents
+    `start:stop`; each block only keeps its own top-k candidates, found with
+    `argpartition`, and those are merged with the running best.
+    """
+    best_scores = np.full((len(queries), 0), -np.inf, dtype=np.float32)
+    best_indices = np.empty((len(queries), 0), dtype=np.int64)
+
+    for start in range(0, num_docs, block_size):
+        scores = score_block(start, min(start + block_size, num_docs))
+
+        if scores.shape[1] > k:
+            top = np.argpartition(scores, -k, axis=1)[:, -k:]
+        else:
+            top = np.broadcast_to(np.arange(scores.shape[1]), scores.shape)
+
+        candidate_scores = np.concatenate([best_scores, np.take_along_axis(scores, top, axis=1)], axis=1)
+        candidate_indices = np.concatenate([best_indices, top + start], axis=1)
+
+        if candidate_scores.shape[1] > k:
+            keep = np.argpartition(candidate_scores, -k, axis=1)[:, -k:]
+            candidate_scores = np.take_along_axis(candidate_scores, keep, axis=1)
+            candidate_indices = np.take_along_axis(candidate_indices, keep, axis=1)
+
+        best_scores, best_indices = candidate_scores, candidate_indices
+
+    return best_indices, best_scores
+
+
+class SimilarityIndex:
+    """Cosine top-k search over a document matrix that is normalized once up front.
+
+    Queries are scored as one matrix product per block of `block_size` documents,
+    so memory stays bounded at (num_queries x block_size) scores no matter how
+    large the corpus is. Each block only keeps its own top-k candidates, found
+    with `argpartition` instead of a full sort (see `blocked_top_k`).
+    """
+
+    def __init__(self, doc_embeddings, block_size=65_536):
+        self.doc_matrix = normalize(doc_embeddings)
+        self.block_size = block_size
+
+    def __len__(self):
+        return self.doc_matrix.shape[0]
+
+    def search(self, query_embeddings, k=1):
+        queries = normalize(query_embeddings)
+        k = min(k, len(self))
+
+        best_indices, best_scores = blocked_top_k(
+            queries, len(self), k, lambda start, stop: queries @ self.doc_matrix[start:stop].T, self.block_size
+        )
+
+        order = np.argsort(-best_scores, axis=1)
+        best_scores = np.take_along_axis(best_scores, order, axis=1)
+        best_indices = np.take_along_axis(best_indices, order, axis=1)
+
+        return best_indices, best_scores
@@ -0,0 +1,178 @@
+import hashlib
+import json
+import logging
+import os
+import struct
+import time
+from array import array
+
+from langchain_core.messages import message_to_dict, messages_from_dict
+
+INDEX_RECORD = struct.Struct("<16sQ")
+
+logger = logging.getLogger(__name__)
+
+
+class ChatHistoryStore:
+    """Append-only JSONL chat history with a compact per-session offset index.
+
+    Every message is appended to `history.jsonl` as one line, and a 24-byte
+    (session digest, byte offset) record is appended to `history.idx`. Loading
+    the last N messages of a session seeks straight to their offsets instead of
+    scanning the segment. Writes are fsynced in batches, and the segment is
+    periodically compacted down to `max_messages_per_session` per session;
+    older messages are dropped at that point and the count is logged.
+
+    On open, a torn last line in the segment and index records pointing past
+    the end of the segment (both possible after a crash) are truncated away.
+    """
+
+    def __init__(self, directory="chat_history", fsync_every=32, fsync_interval=1.0,
+                 max_messages_per_session=1000, compact_every=10_000):
+        self.directory = directory
+        self.fsync_every = fsync_every
+        self.fsync_interval = fsync_interval
+        self.max_messages_per_session = max_messages_per_session
+        self.compact_every = compact_every
+
+        os.makedirs(directory, exist_ok=True)
+        self.segment_path = os.path.join(directory, "history.jsonl")
+        self.index_path = os.path.join(directory, "history.idx")
+
+        self.offsets = {}
+        self._open()
+
+    @staticmethod
+    def _digest(session_id):
+        return hashlib.md5(session_id.encode("utf-8")).digest()
+
+    def _recover_segment(self):
+        """Truncate a torn last line and return the segment's valid length."""
+        if not os.path.exists(self.segment_path):
+            return 0
+
+        with open(self.segment_path, "rb+") as f:
+            size = end = f.seek(0, os.SEEK_END)
+            while end > 0:
+                start = max(0, end - 4096)
+                f.seek(start)
+                newline = f.read(end - start).rfind(b"\n")
+                end = start + newline + 1 if newline != -1 else start
+                if newline != -1:
+                    break
+            if end < size:
+                logger.warning("Truncating %d bytes of torn data from %s", size - end, self.segment_path)
+                f.truncate(end)
+        return end
+
+    def _open(self):
+        self.offsets = {}
+        segment_size = self._recover_segment()
+
+        if os.path.exists(self.index_path):
+            with open(self.index_path, "rb") as f:
+                data = f.read()
+            valid = 0
+            for digest, offset in INDEX_RECORD.iter_unpack(data[:len(data) - len(data) % INDEX_RECORD.size]):
+                if offset >= segment_size:
+                    break
+                self.offsets.setdefault(digest, array("Q")).append(offset)
+                valid += 1
+            if valid * INDEX_RECORD.size < len(data):
+                logger.warning("Dropping %d invalid index records from %s",
+                               (len(data) - valid * INDEX_RECORD.size + INDEX_RECORD.size - 1) // INDEX_RECORD.size,
+                               self.index_path)
+                with open(self.index_path, "rb+") as f:
+                    f.truncate(valid * INDEX_RECORD.size)
+
+        self.segment = open(self.segment_path, "ab")
+        self.index = open(self.index_path, "ab")
+        self.reader = open(self.segment_path, "rb")
+
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+        self.appended_since_compaction = 0
+
+    def append(self, session_id, message):
+        line = json.dumps(message_to_dict(message), ensure_ascii=False).encode("utf-8") + b"\n"
+        digest = self._digest(session_id)
+
+        offset = self.segment.tell()
+        self.segment.write(line)
+        self.index.write(INDEX_RECORD.pack(digest, offset))
+        self.offsets.setdefault(digest, array("Q")).append(offset)
+
+        self.unsynced += 1
+        self.appended_since_compaction += 1
+
+        if self.unsynced >= self.fsync_every or time.monotonic() - self.last_sync >= self.fsync_interval:
+            self.sync()
+
+        if self.appended_since_compaction >= self.compact_every:
+            self.compact()
+
+    def extend(self, session_id, messages):
+        for message in messages:
+            self.append(session_id, message)
+
+    def sync(self):
+        self.segment.flush()
+        os.fsync(self.segment.fileno())
+        self.index.flush()
+        os.fsync(self.index.fileno())
+
+        self.unsynced = 0
+        self.last_sync = time.monotonic()
+
+    def _read_lines(self, offsets):
+        self.segment.flush()
+
+        lines = []
+        for offset in offsets:
+            self.reader.seek(offset)
+            lines.append(self.reader.readline())
+        return lines
+
+    def load(self, session_id, last_n=20):
+        offsets = self.offsets.get(self._digest(session_id), array("Q"))
+        if last_n is not None:
+            offsets = offsets[-last_n:] if last_n else array("Q")
+
+        records = []
+        for line in self._read_lines(offsets):
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                logger.warning("Skipping unreadable message in session %r", session_id)
+        return messages_from_dict(records)
+
+    def compact(self):
+        self.sync()
+
+        segment_tmp = self.segment_path + ".tmp"
+        index_tmp = self.index_path + ".tmp"
+
+        with open(segment_tmp, "wb") as segment, open(index_tmp, "wb") as index:
+            for digest, offsets in self.offsets.items():
+                dropped = len(offsets) - self.max_messages_per_session
+                if dropped > 0:
+                    logger.info("Compaction dropped %d old messages from session %s", dropped, digest.hex())
+                for line in self._read_lines(offsets[-self.max_messages_per_session:]):
+                    index.write(INDEX_RECORD.pack(digest, segment.tell()))
+                    segment.write(line)
+
+            segment.flush()
+            os.fsync(segment.fileno())
+            index.flush()
+            os.fsync(index.fileno())
+
+        self.close()
+        os.replace(segment_tmp, self.segment_path)
+        os.replace(index_tmp, self.index_path)
+        self._open()
+
+    def close(self):
+        self.sync()
+        self.segment.close()
+        self.index.close()
+        self.reader.close()
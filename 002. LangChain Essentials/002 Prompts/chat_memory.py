@@ -0,0 +1,128 @@
+import logging
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+
+from langchain_core.messages import SystemMessage, HumanMessage
+
+logger = logging.getLogger(__name__)
+
+
+class RollingChatMemory:
+    """Chat history that stays inside a token budget.
+
+    The system message and the most recent messages are kept verbatim. Once the
+    budget is exceeded, the oldest messages are folded into a running summary
+    that a background thread updates incrementally with `summary_model`. Each
+    message is counted once when added, so trimming is O(1) per turn.
+
+    Evicted messages stay in the history, after the summary, until a summary
+    that covers them lands, so nothing is lost while the summarizer runs or
+    if it fails; failures are logged and retried on the next turn. The
+    summary is kept under `summary_max_tokens` (a quarter of `max_tokens` by
+    default), so system message, summary and recent messages fit the budget
+    once the summarizer has caught up.
+    """
+
+    def __init__(self, system_message, max_tokens=2000, summary_model=None, token_counter=None,
+                 summary_max_tokens=None):
+        self.system_message = system_message
+        self.max_tokens = max_tokens
+        self.summary_model = summary_model
+        self.token_counter = token_counter or (lambda text: max(1, len(text) // 4))
+        self.summary_max_tokens = summary_max_tokens or max_tokens // 4
+
+        self.system_tokens = self.token_counter(system_message.content)
+        self.recent = deque()
+        self.recent_tokens = 0
+
+        self.summary = ""
+        self.summary_tokens = 0
+        self.pending = []
+        self.stats = {"summaries": 0, "failures": 0}
+        self._lock = Lock()
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._summary_future = None
+
+    def add_message(self, message):
+        tokens = self.token_counter(message.content)
+        self.recent.append((message, tokens))
+        self.recent_tokens += tokens
+        self._trim()
+
+    def _budget(self):
+        return self.max_tokens - self.system_tokens - self.summary_tokens
+
+    def _trim(self):
+        if self.summary_model is None:
+            while len(self.recent) > 1 and self.recent_tokens > self._budget():
+                _, tokens = self.recent.popleft()
+                self.recent_tokens -= tokens
+            return
+
+        with self._lock:
+            while len(self.recent) > 1 and self.recent_tokens > self._budget():
+                message, tokens = self.recent.popleft()
+                self.recent_tokens -= tokens
+                self.pending.append(message)
+            has_pending = bool(self.pending)
+
+        if has_pending and (self._summary_future is None or self._summary_future.done()):
+            self._summary_future = self._executor.submit(self._summarize)
+
+    def _truncate(self, text, limit):
+        if self.token_counter(text) <= limit:
+            return text
+
+        low, high = 0, len(text)
+        while low < high:
+            middle = (low + high + 1) // 2
+            if self.token_counter(text[:middle]) <= limit:
+                low = middle
+            else:
+                high = middle - 1
+        return text[:low]
+
+    def _summarize(self):
+        while True:
+            with self._lock:
+                if not self.pending:
+                    return
+                messages = list(self.pending)
+                summary = self.summary
+
+            transcript = "\n".join(f"{message.type}: {message.content}" for message in messages)
+            prompt = (
+                "Update the running summary of a conversation with the new messages. "
+                "Keep it short and keep every fact the assistant may need later. "
+                f"Use at most {self.summary_max_tokens} tokens.\n\n"
+                f"Current summary:\n{summary or '(empty)'}\n\nNew messages:\n{transcript}"
+            )
+            try:
+                result = self.summary_model.invoke([HumanMessage(content=prompt)])
+            except Exception:
+                # The messages stay pending (and in the history); the next turn retries.
+                self.stats["failures"] += 1
+                logger.exception("Summarizing %d evicted messages failed", len(messages))
+                return
+
+            new_summary = self._truncate(result.content, self.summary_max_tokens)
+            with self._lock:
+                self.summary = new_summary
+                self.summary_tokens = self.token_counter(new_summary)
+                del self.pending[:len(messages)]
+                self.stats["summaries"] += 1
+
+    def messages(self):
+        history = [self.system_message]
+
+        with self._lock:
+            if self.summary:
+                history.append(SystemMessage(content=f"Summary of the earlier conversation: {self.summary}"))
+            history.extend(self.pending)
+            history.extend(message for message, _ in self.recent)
+
+        return history
+
+    def close(self):
+        self._executor.shutdown(wait=True)
\ No newline at end of file
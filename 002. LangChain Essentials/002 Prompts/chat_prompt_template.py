@@ -1,8 +1,9 @@
 from langchain_core.prompts import ChatPromptTemplate
+from compiled_template import CompiledChatPromptTemplate
 
-chat_template = ChatPromptTemplate([
+chat_template = CompiledChatPromptTemplate.from_prompt(ChatPromptTemplate([
     ("system", "You are a helpful {domain} expert."),
     ("human", "Explain in simple terms, what is {topic}?")
-])
+]))
 
 prompt = chat_template.invoke({"domain": "Bioinformatics", "topic": "Precision Medicine"})
\ No newline at end of file
@@ -1,25 +1,30 @@
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.messages import SystemMessage, HumanMessage, AIMessage
 from dotenv import load_dotenv
+from chat_memory import RollingChatMemory
 
 
 load_dotenv()
 
 model = ChatGoogleGenerativeAI(model="gemini-1.5-pro")
 
-chat_history = [
-    SystemMessage(content="You are a helpful AI assistant.")
-]
+chat_history = RollingChatMemory(
+    SystemMessage(content="You are a helpful AI assistant."),
+    max_tokens=2000,
+    summary_model=model,
+)
 
 while True:
     user_input = input("You: ")
-    chat_history.append(HumanMessage(content=user_input))
+    chat_history.add_message(HumanMessage(content=user_input))
 
     if user_input == "exit":
         break
 
-    result = model.invoke(chat_history)
-    chat_history.append(AIMessage(content=result.content))
+    result = model.invoke(chat_history.messages())
+    chat_history.add_message(AIMessage(content=result.content))
     print(f"AI: {result.content}")
 
+chat_history.close()
+
 print("Goodbye!")
\ No newline at end of file
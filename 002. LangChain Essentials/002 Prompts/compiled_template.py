@@ -0,0 +1,206 @@
+import threading
+from collections import OrderedDict
+from string import Formatter
+
+from langchain_core.messages import BaseMessage, SystemMessage, HumanMessage, AIMessage
+from langchain_core.prompt_values import StringPromptValue, ChatPromptValue
+from langchain_core.prompts import MessagesPlaceholder
+from langchain_core.runnables import Runnable
+
+MESSAGE_TYPES = {
+    "system": SystemMessage,
+    "human": HumanMessage,
+    "user": HumanMessage,
+    "ai": AIMessage,
+    "assistant": AIMessage,
+}
+
+PROMPT_ROLES = {
+    "SystemMessagePromptTemplate": "system",
+    "HumanMessagePromptTemplate": "human",
+    "AIMessagePromptTemplate": "ai",
+}
+
+
+def _check_format(prompt):
+    template_format = getattr(prompt, "template_format", "f-string")
+    if template_format != "f-string" or not isinstance(getattr(prompt, "template", None), str):
+        raise ValueError(f"Only f-string text templates can be compiled, got {type(prompt).__name__} "
+                         f"with template_format={template_format!r}.")
+
+
+def compile_segments(template, partial_variables=None):
+    partial_variables = partial_variables or {}
+    formatter = Formatter()
+    segments = []
+
+    def add_literal(text):
+        if not text:
+            return
+        if segments and isinstance(segments[-1], str):
+            segments[-1] += text
+        else:
+            segments.append(text)
+
+    for literal, field_name, format_spec, conversion in formatter.parse(template):
+        add_literal(literal)
+
+        if field_name is None:
+            continue
+
+        value = partial_variables.get(field_name)
+        if field_name in partial_variables and not callable(value):
+            add_literal(formatter.format_field(formatter.convert_field(value, conversion), format_spec))
+        else:
+            segments.append((field_name, format_spec, conversion))
+
+    return segments
+
+
+class _Renderer:
+    def __init__(self, segments, cache_size, partial_variables=None):
+        self.segments = segments
+        self.variables = tuple(dict.fromkeys(s[0] for s in segments if not isinstance(s, str)))
+        self.callables = {
+            name: value for name, value in (partial_variables or {}).items() if name in self.variables and callable(value)
+        }
+        self.input_variables = [name for name in self.variables if name not in self.callables]
+        self.cache_size = cache_size
+        self.cache = OrderedDict()
+        self.lock = threading.Lock()
+
+    def render(self, inputs):
+        if self.callables:
+            # Callable partials (dates, counters, ...) are evaluated on every render.
+            inputs = {**{name: value() for name, value in self.callables.items() if name not in inputs}, **inputs}
+
+        # Keyed on type too: True, 1 and 1.0 are equal but render differently.
+        values = tuple((type(inputs[name]), inputs[name]) for name in self.variables)
+
+        try:
+            with self.lock:
+                text = self.cache.get(values)
+                if text is not None:
+                    self.cache.move_to_end(values)
+                    return text
+        except TypeError:
+            return self._render(inputs)
+
+        text = self._render(inputs)
+
+        if self.cache_size:
+            with self.lock:
+                self.cache[values] = text
+                if len(self.cache) > self.cache_size:
+                    self.cache.popitem(last=False)
+
+        return text
+
+    def _render(self, inputs):
+        formatter = Formatter()
+        parts = []
+        for segment in self.segments:
+            if isinstance(segment, str):
+                parts.append(segment)
+                continue
+
+            name, format_spec, conversion = segment
+            value = inputs[name]
+            if format_spec or conversion:
+                parts.append(formatter.format_field(formatter.convert_field(value, conversion), format_spec))
+            else:
+                parts.append(str(value))
+
+        return "".join(parts)
+
+
+class CompiledPromptTemplate(Runnable):
+    """A string prompt template that is parsed once and rendered with a single join.
+
+    Constant partial variables are baked into the literal segments at compile
+    time; callable partials are evaluated on every render. Fully rendered
+    prompts are memoized for repeated inputs. It is a Runnable, so it composes
+    with `|` on either side and supports batch/stream like PromptTemplate.
+    """
+
+    def __init__(self, template, partial_variables=None, cache_size=1024):
+        self.renderer = _Renderer(compile_segments(template, partial_variables), cache_size, partial_variables)
+        self.input_variables = list(self.renderer.input_variables)
+
+    @classmethod
+    def from_prompt(cls, prompt, cache_size=1024):
+        _check_format(prompt)
+        return cls(prompt.template, prompt.partial_variables, cache_size)
+
+    def format(self, **kwargs):
+        return self.renderer.render(kwargs)
+
+    def _format_prompt(self, input):
+        return StringPromptValue(text=self.renderer.render(input))
+
+    def invoke(self, input, config=None, **kwargs):
+        return self._call_with_config(self._format_prompt, input, config, run_type="prompt")
+
+
+class CompiledChatPromptTemplate(Runnable):
+    """Chat prompt template compiled like CompiledPromptTemplate.
+
+    `messages` holds (role, template) pairs, fixed messages and
+    MessagesPlaceholders; ("placeholder", "{name}") is an optional
+    placeholder, as in ChatPromptTemplate.
+    """
+
+    def __init__(self, messages, partial_variables=None, cache_size=1024):
+        self.messages = []
+        input_variables = []
+        for message in messages:
+            if isinstance(message, (MessagesPlaceholder, BaseMessage)):
+                self.messages.append(message)
+                if isinstance(message, MessagesPlaceholder) and not message.optional:
+                    input_variables.append(message.variable_name)
+                continue
+
+            role, template = message
+            if role == "placeholder":
+                self.messages.append(MessagesPlaceholder(variable_name=template.strip("{}"), optional=True))
+                continue
+            if role not in MESSAGE_TYPES:
+                raise ValueError(f"Unsupported message role {role!r}; expected one of {sorted(MESSAGE_TYPES)}.")
+
+            renderer = _Renderer(compile_segments(template, partial_variables), cache_size, partial_variables)
+            self.messages.append((MESSAGE_TYPES[role], renderer))
+            input_variables.extend(renderer.input_variables)
+
+        self.input_variables = list(dict.fromkeys(input_variables))
+
+    @classmethod
+    def from_prompt(cls, prompt, cache_size=1024):
+        messages = []
+        for message in prompt.messages:
+            if isinstance(message, (MessagesPlaceholder, BaseMessage)):
+                messages.append(message)
+            elif type(message).__name__ in PROMPT_ROLES:
+                _check_format(message.prompt)
+                messages.append((PROMPT_ROLES[type(message).__name__], message.prompt.template))
+            else:
+                raise ValueError(f"Cannot compile {type(message).__name__}; only system/human/ai text templates, "
+                                 "fixed messages and MessagesPlaceholder are supported.")
+        return cls(messages, prompt.partial_variables, cache_size)
+
+    def format_messages(self, **kwargs):
+        messages = []
+        for message in self.messages:
+            if isinstance(message, MessagesPlaceholder):
+                messages.extend(message.format_messages(**kwargs))
+            elif isinstance(message, BaseMessage):
+                messages.append(message)
+            else:
+                message_type, renderer = message
+                messages.append(message_type(content=renderer.render(kwargs)))
+        return messages
+
+    def _format_prompt(self, input):
+        return ChatPromptValue(messages=self.format_messages(**input))
+
+    def invoke(self, input, config=None, **kwargs):
+        return self._call_with_config(self._format_prompt, input, config, run_type="prompt")
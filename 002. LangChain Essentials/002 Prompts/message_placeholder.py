@@ -1,4 +1,5 @@
 from langchain_core.prompts import MessagePlaceholder, ChatPromptTemplate
+from chat_history_store import ChatHistoryStore
 
 chat_template = ChatPromptTemplate([
     ("system", "You are a helpful AI biologist."),
@@ -6,10 +7,11 @@ chat_template = ChatPromptTemplate([
     ("human", "{query}")
 ])
 
-chat_history = []
+store = ChatHistoryStore(directory="chat_history")
 
-with open("chat_history.txt", "r") as f:
-    chat_history.extend(f.readlines())
+chat_history = store.load(session_id="default", last_n=20)
 
 prompt = chat_template.invoke({"chat_history": chat_history, "query": "What is the meaning of life?"})
-print(prompt)
\ No newline at end of file
+print(prompt)
+
+store.close()
\ No newline at end of file
@@ -0,0 +1,61 @@
+import time
+
+from langchain_core.prompts import PromptTemplate, ChatPromptTemplate
+from langchain_core.output_parsers import PydanticOutputParser
+from pydantic import BaseModel, Field
+from typing import Optional
+
+from compiled_template import CompiledPromptTemplate, CompiledChatPromptTemplate
+
+RENDERS = 20_000
+TOPICS = [f"topic {i}" for i in range(100)]
+
+
+class DatabaseFeatures(BaseModel):
+    name: str = Field(description="Name of the database.")
+    origin: str = Field(description="Origin of the database.")
+    data_size: Optional[float] = Field(gt=0, description="Size of the database in GB (must be > 0).")
+    applications: str = Field(description="Uses and applications of the database.")
+
+
+parser = PydanticOutputParser(pydantic_object=DatabaseFeatures)
+
+prompt = PromptTemplate(
+    template="Provide name, origin, data size (in GB), and applications of the {database}. \n {format_instructions}",
+    input_variables=["database"],
+    partial_variables={"format_instructions": parser.get_format_instructions()},
+)
+
+chat_prompt = ChatPromptTemplate([
+    ("system", "You are a helpful {domain} expert."),
+    ("human", "Explain in simple terms, what is {topic}?")
+])
+
+
+def renders_per_second(render):
+    start = time.perf_counter()
+    for i in range(RENDERS):
+        render(TOPICS[i % len(TOPICS)])
+    return RENDERS / (time.perf_counter() - start)
+
+
+compiled_prompt = CompiledPromptTemplate.from_prompt(prompt)
+compiled_chat_prompt = CompiledChatPromptTemplate.from_prompt(chat_prompt)
+
+for topic in TOPICS[:3]:
+    assert compiled_prompt.invoke({"database": topic}).text == prompt.invoke({"database": topic}).text
+    assert compiled_chat_prompt.invoke({"domain": "Bioinformatics", "topic": topic}).to_messages() == \
+        chat_prompt.invoke({"domain": "Bioinformatics", "topic": topic}).to_messages()
+
+benchmarks = [
+    ("PromptTemplate", lambda t: prompt.invoke({"database": t}),
+     lambda t: compiled_prompt.invoke({"database": t})),
+    ("ChatPromptTemplate", lambda t: chat_prompt.invoke({"domain": "Bioinformatics", "topic": t}),
+     lambda t: compiled_chat_prompt.invoke({"domain": "Bioinformatics", "topic": t})),
+]
+
+for name, before, after in benchmarks:
+    before_rate = renders_per_second(before)
+    after_rate = renders_per_second(after)
+    print(f"{name:>18} | before: {before_rate:10.0f} renders/s | after: {after_rate:10.0f} renders/s | "
+          f"speedup: {after_rate / before_rate:5.1f}x")
@@ -0,0 +1,83 @@
+import json
+from functools import lru_cache
+from typing import Any, List, Literal, Optional, Union
+
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter, create_model
+
+JSON_TYPES = {
+    "string": str,
+    "number": float,
+    "integer": int,
+    "boolean": bool,
+    "object": dict,
+    "null": type(None),
+}
+
+
+def _annotation(prop, name):
+    if "enum" in prop:
+        return Literal[tuple(prop["enum"])]
+
+    options = prop.get("anyOf") or prop.get("oneOf")
+    if options:
+        return Union[tuple(_annotation(option, name) for option in options)]
+
+    kind = prop.get("type")
+    if isinstance(kind, list):
+        return Union[tuple(_annotation({**prop, "type": k}, name) for k in kind)]
+    if prop.get("nullable"):
+        return Optional[_annotation({**prop, "nullable": False}, name)]
+
+    if kind == "array":
+        return List[_annotation(prop.get("items", {}), name)]
+    if kind == "object" and "properties" in prop:
+        return model_from_json_schema({"title": name.title().replace("_", ""), **prop})
+    return JSON_TYPES.get(kind, Any)
+
+
+def model_from_json_schema(schema):
+    """Build a strict pydantic model from a JSON schema object.
+
+    Strict mode keeps the types the schema asks for: "12.5" is not a number and
+    1.0 is not an integer. List types and `nullable` become unions, and nested
+    objects with their own `properties` become nested models.
+    """
+    required = set(schema.get("required", []))
+    fields = {}
+
+    for name, prop in schema["properties"].items():
+        annotation = _annotation(prop, name)
+        if name in required:
+            fields[name] = (annotation, Field(description=prop.get("description")))
+        else:
+            fields[name] = (Optional[annotation], Field(None, description=prop.get("description")))
+
+    return create_model(schema.get("title", "Model"), __config__=ConfigDict(strict=True), **fields)
+
+
+@lru_cache(maxsize=None)
+def _compile_type(schema):
+    if isinstance(schema, type) and issubclass(schema, BaseModel):
+        return schema.model_validate_json
+    return TypeAdapter(schema).validate_json
+
+
+@lru_cache(maxsize=None)
+def _compile_json_schema(schema_key):
+    return model_from_json_schema(json.loads(schema_key)).model_validate_json
+
+
+def compile_validator(schema):
+    """Return a cached validator that turns raw JSON (str or bytes) into a validated object.
+
+    `schema` can be a pydantic model, a TypedDict or a JSON schema dict; each is
+    compiled once and validated with pydantic-core straight from the raw
+    response, without building an intermediate dict.
+    """
+    if isinstance(schema, dict):
+        return _compile_json_schema(json.dumps(schema, sort_keys=True))
+    return _compile_type(schema)
+
+
+def validate_response(schema, raw):
+    return compile_validator(schema)(raw)
@@ -0,0 +1,97 @@
+import json
+import random
+import time
+from typing import List, Literal, Optional
+
+from pydantic import BaseModel, Field, TypeAdapter
+from typing_extensions import NotRequired, TypedDict
+
+from structured_validator import compile_validator, model_from_json_schema
+
+NUM_RESPONSES = 100_000
+
+with open("json_schema.json", "r") as f:
+    json_schema = json.load(f)
+
+
+class Gene(BaseModel):
+    summary: str = Field(description="A brief summary of the gene.")
+    function: str = Field(description="The function of the gene.")
+    location: str = Field(description="The location of the gene on the chromosome.")
+    associated_diseases: List[str] = Field(description="A list of diseases associated with this gene.")
+    expression_level: Optional[float] = Field(None, description="The expression level of the gene in a given condition. Optional.")
+    mutation_types: Optional[List[str]] = Field(None, description="Types of mutations commonly found in this gene. Optional.")
+    gene_type: Literal["oncogene", "tumor suppressor", "housekeeping"] = Field(description="The functional category of the gene.")
+
+
+class GeneDict(TypedDict):
+    summary: str
+    function: str
+    location: str
+    associated_diseases: List[str]
+    expression_level: NotRequired[Optional[float]]
+    mutation_types: NotRequired[Optional[List[str]]]
+    gene_type: Literal["oncogene", "tumor suppressor", "housekeeping"]
+
+
+def synthetic_responses(count):
+    rng = random.Random(0)
+    genes = ["TP53", "BRCA1", "EGFR", "AKT1", "VEGFA", "KRAS", "MYC", "PTEN"]
+    diseases = ["HCC", "breast cancer", "ovarian cancer", "NSCLC", "glioblastoma", "colorectal cancer"]
+
+    responses = []
+    for i in range(count):
+        gene = rng.choice(genes)
+        response = {
+            "summary": f"{gene} is a gene involved in cancer biology (sample {i}).",
+            "function": f"{gene} regulates cell growth and DNA repair.",
+            "location": f"chromosome {rng.randint(1, 22)}p{rng.randint(11, 36)}.{rng.randint(1, 3)}",
+            "associated_diseases": rng.sample(diseases, rng.randint(1, 4)),
+            "gene_type": rng.choice(["oncogene", "tumor suppressor", "housekeeping"]),
+        }
+        if rng.random() < 0.5:
+            response["expression_level"] = round(rng.uniform(0, 20), 3)
+        if rng.random() < 0.5:
+            response["mutation_types"] = rng.sample(["missense", "nonsense", "frameshift", "deletion"], 2)
+        responses.append(json.dumps(response).encode("utf-8"))
+
+    return responses
+
+
+responses = synthetic_responses(NUM_RESPONSES)
+
+generic_paths = {
+    "JSON schema": model_from_json_schema(json_schema).model_validate,
+    "BaseModel": Gene.model_validate,
+    "TypedDict": TypeAdapter(GeneDict).validate_python,
+}
+
+schemas = {
+    "JSON schema": json_schema,
+    "BaseModel": Gene,
+    "TypedDict": GeneDict,
+}
+
+for name, schema in schemas.items():
+    start = time.perf_counter()
+    validate = compile_validator(schema)
+    compile_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    compile_validator(schema)
+    cached_time = time.perf_counter() - start
+
+    generic_validate = generic_paths[name]
+    start = time.perf_counter()
+    for raw in responses:
+        generic_validate(json.loads(raw))
+    generic_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for raw in responses:
+        validate(raw)
+    compiled_time = time.perf_counter() - start
+
+    print(f"{name:>11} | compile: {compile_time * 1e3:7.2f} ms (cached: {cached_time * 1e6:5.1f} us) | "
+          f"json.loads + validate: {NUM_RESPONSES / generic_time:9.0f}/s | "
+          f"validate_json: {NUM_RESPONSES / compiled_time:9.0f}/s | speedup: {generic_time / compiled_time:4.1f}x")
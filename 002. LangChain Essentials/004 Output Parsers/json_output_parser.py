@@ -2,6 +2,7 @@ from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.prompts import PromptTemplate
 from langchain_core.output_parsers import JsonOutputParser
 from dotenv import load_dotenv
+from streaming_json_parser import StreamingJsonOutputParser
 
 load_dotenv()
 
@@ -21,8 +22,7 @@ template = PromptTemplate(
 
 # parsed_result = parser.parse(result.content)
 
-chain = template | model | parser
+chain = template | model | StreamingJsonOutputParser
 
-result = chain.invoke({"protein database": "PDB"})
-
-print(result)
\ No newline at end of file
+for field in chain.stream({"protein database": "PDB"}):
+    print(field)
\ No newline at end of file
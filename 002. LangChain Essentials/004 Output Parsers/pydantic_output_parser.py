@@ -4,6 +4,7 @@ from langchain_core.output_parsers import PydanticOutputParser
 from pydantic import BaseModel, Field
 from typing import Optional
 from dotenv import load_dotenv
+from repairing_output_parser import RepairingOutputParser
 
 load_dotenv()
 
@@ -15,7 +16,7 @@ class DatabaseFeatures(BaseModel):
     data_size: Optional[float] = Field(gt=0, description="Size of the database in GB (must be > 0).")
     applications: str = Field(description="Uses and applications of the database.")
 
-parser = PydanticOutputParser(pydantic_object=DatabaseFeatures)
+parser = RepairingOutputParser(parser=PydanticOutputParser(pydantic_object=DatabaseFeatures), llm=model)
 
 template = PromptTemplate(
     template="Provide name, origin, data size (in GB), and applications of the {database}. \n {format_instructions}",
@@ -33,4 +34,5 @@ chain = template | model | parser
 
 result = chain.invoke({"database": "Swiss-prot"})
 
-print(result)
\ No newline at end of file
+print(result)
+print(parser.metrics)
\ No newline at end of file
@@ -0,0 +1,209 @@
+import ast
+import json
+import re
+import typing
+from collections import Counter
+from typing import Any, Optional
+
+from langchain_core.exceptions import OutputParserException
+from langchain_core.output_parsers import BaseOutputParser, PydanticOutputParser
+from pydantic import Field, ValidationError
+
+FENCE = re.compile(r"```(?:json)?\s*(.*?)```", re.DOTALL)
+QUOTED = r"\"(?:\\.|[^\"\\])*\"|'(?:\\.|[^'\\])*'"
+TRAILING_COMMA = re.compile(QUOTED + r"|,\s*([}\]])")
+LITERAL = re.compile(QUOTED + r"|\b(true|false|null)\b")
+NUMBER = re.compile(r"([-+]?\d[\d,]*(?:\.\d+)?(?:[eE][-+]?\d+)?|[-+]?\.\d+)(?:\s*([A-Za-z]+)\b)?")
+FIELD_UNIT = re.compile(r"\bin\s+([A-Za-z]+)\b")
+PYTHON_LITERALS = {"true": "True", "false": "False", "null": "None"}
+SMART_QUOTES = str.maketrans({"“": '"', "”": '"', "‘": "'", "’": "'"})
+
+# unit -> (dimension, factor to the dimension's base unit)
+UNITS = {
+    "b": ("bytes", 1), "byte": ("bytes", 1), "bytes": ("bytes", 1),
+    "kb": ("bytes", 1e3), "mb": ("bytes", 1e6), "gb": ("bytes", 1e9), "tb": ("bytes", 1e12), "pb": ("bytes", 1e15),
+    "kib": ("bytes", 2**10), "mib": ("bytes", 2**20), "gib": ("bytes", 2**30), "tib": ("bytes", 2**40),
+    "ms": ("seconds", 1e-3), "s": ("seconds", 1), "sec": ("seconds", 1), "seconds": ("seconds", 1),
+    "min": ("seconds", 60), "minutes": ("seconds", 60), "h": ("seconds", 3600), "hours": ("seconds", 3600),
+    "days": ("seconds", 86400),
+}
+
+
+def extract_json_span(text):
+    fenced = FENCE.search(text)
+    if fenced:
+        text = fenced.group(1)
+
+    start = text.find("{")
+    if start == -1:
+        return text.strip()
+
+    depth = 0
+    quote = None
+    escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if quote:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == quote:
+                quote = None
+        elif char in "\"'":
+            quote = char
+        elif char == "{":
+            depth += 1
+        elif char == "}":
+            depth -= 1
+            if depth == 0:
+                return text[start:i + 1]
+
+    return text[start:]
+
+
+def _sub_outside_strings(pattern, replace, text):
+    # `pattern` matches quoted strings first, so only unquoted matches (group 1) are replaced.
+    return pattern.sub(lambda m: replace(m) if m.group(1) is not None else m.group(0), text)
+
+
+def load_lenient_json(span):
+    span = _sub_outside_strings(TRAILING_COMMA, lambda m: m.group(1), span.translate(SMART_QUOTES))
+
+    try:
+        value = json.loads(span)
+    except json.JSONDecodeError:
+        python_span = _sub_outside_strings(LITERAL, lambda m: PYTHON_LITERALS[m.group(1)], span)
+        value = ast.literal_eval(python_span)
+
+    if not isinstance(value, dict):
+        raise ValueError("Repaired output is not a JSON object.")
+    return value
+
+
+def _base_type(annotation):
+    if typing.get_origin(annotation) is typing.Union:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return args[0]
+    return annotation
+
+
+def field_unit(name, field):
+    extra = field.json_schema_extra if isinstance(field.json_schema_extra, dict) else {}
+    candidates = [extra.get("unit"), name.rsplit("_", 1)[-1]]
+    candidates += FIELD_UNIT.findall(field.description or "")
+    for unit in candidates:
+        if unit and unit.lower() in UNITS:
+            return unit.lower()
+    return None
+
+
+def convert_number(value, unit, target_unit):
+    if unit is None or unit.lower() == target_unit:
+        return value
+
+    source = UNITS.get(unit.lower())
+    if target_unit is None:
+        if source is not None:
+            raise ValueError(f"Value in {unit} for a field without a declared unit.")
+        return value  # a plain count such as "1,200 entries"
+
+    target = UNITS[target_unit]
+    if source is None or source[0] != target[0]:
+        raise ValueError(f"Cannot convert {unit} to {target_unit}.")
+    return value * source[1] / target[1]
+
+
+def coerce_fields(data, model):
+    if not isinstance(data, dict):
+        raise ValueError("Repaired output is not a JSON object.")
+
+    for name, field in model.model_fields.items():
+        key = name if name in data else field.alias
+        if key not in data:
+            continue
+
+        value = data[key]
+        target = _base_type(field.annotation)
+
+        if target in (int, float) and isinstance(value, str):
+            match = NUMBER.search(value)
+            if match:
+                number = float(match.group(1).replace(",", ""))
+                number = convert_number(number, match.group(2), field_unit(name, field))
+                data[key] = int(number) if target is int and number.is_integer() else number
+        elif target is bool and isinstance(value, str):
+            lowered = value.strip().lower()
+            if lowered in ("true", "yes", "y", "1"):
+                data[key] = True
+            elif lowered in ("false", "no", "n", "0"):
+                data[key] = False
+        elif target is str and isinstance(value, (int, float)) and not isinstance(value, bool):
+            data[key] = str(value)
+
+    return data
+
+
+class RepairingOutputParser(BaseOutputParser):
+    """PydanticOutputParser with a deterministic local repair stage before any LLM retry.
+
+    Malformed output is repaired without a model call: the JSON span is cut out
+    of fences or surrounding prose, quoting and trailing commas are normalized,
+    numeric strings are coerced per field type, and the result is
+    re-validated. Units are converted to the field's unit (taken from
+    `json_schema_extra={"unit": ...}`, a `_gb`-style name suffix or "in GB"
+    in the description); a unit that cannot be converted fails the repair
+    instead of being dropped. Only if that fails is `llm` asked to fix the
+    output. Outcomes are counted in `metrics` ("parsed", "repaired",
+    "llm_fixed", "failed").
+    """
+
+    parser: PydanticOutputParser
+    llm: Optional[Any] = None
+    metrics: Counter = Field(default_factory=Counter)
+
+    def repair(self, text):
+        model = self.parser.pydantic_object
+        data = coerce_fields(load_lenient_json(extract_json_span(text)), model)
+        return model.model_validate(data)
+
+    def parse(self, text):
+        try:
+            result = self.parser.parse(text)
+            self.metrics["parsed"] += 1
+            return result
+        except OutputParserException as error:
+            parse_error = error
+
+        try:
+            result = self.repair(text)
+            self.metrics["repaired"] += 1
+            return result
+        except (ValueError, SyntaxError, ValidationError):
+            pass
+
+        if self.llm is not None:
+            prompt = (
+                "The following output does not match the required format.\n\n"
+                f"Output:\n{text}\n\nError:\n{parse_error}\n\n"
+                f"{self.parser.get_format_instructions()}\n\nReturn only the corrected output."
+            )
+            fixed = self.llm.invoke(prompt).content
+
+            try:
+                result = self.repair(fixed)
+                self.metrics["llm_fixed"] += 1
+                return result
+            except (ValueError, SyntaxError, ValidationError):
+                pass
+
+        self.metrics["failed"] += 1
+        raise parse_error
+
+    def get_format_instructions(self):
+        return self.parser.get_format_instructions()
+
+    @property
+    def _type(self):
+        return "repairing_pydantic"
@@ -0,0 +1,147 @@
+import json
+
+from langchain_core.exceptions import OutputParserException
+from langchain_core.runnables import RunnableGenerator
+from langchain_core.runnables.utils import AddableDict
+
+WHITESPACE = " \t\r\n"
+
+BEFORE_OBJECT = 0
+EXPECT_KEY = 1
+IN_KEY = 2
+EXPECT_COLON = 3
+EXPECT_VALUE = 4
+IN_VALUE = 5
+AFTER_VALUE = 6
+DONE = 7
+
+
+class IncrementalJsonParser:
+    """Resumable parser that emits top-level fields of a JSON object as soon as they close.
+
+    Every character is looked at exactly once, so feeding N chunks costs
+    O(total length) instead of re-parsing the growing buffer on every chunk.
+    Anything before the first `{` (prose, a ```json fence) is skipped.
+    """
+
+    def __init__(self):
+        self.state = BEFORE_OBJECT
+        self.key = []
+        self.value = []
+        self.depth = 0
+        self.in_string = False
+        self.escaped = False
+        self.current_key = None
+        self.result = {}
+
+    def _finish_value(self):
+        value = json.loads("".join(self.value))
+        self.result[self.current_key] = value
+        self.value = []
+        self.state = AFTER_VALUE
+        return self.current_key, value
+
+    def feed(self, chunk):
+        fields = []
+
+        for char in chunk:
+            state = self.state
+
+            if state == BEFORE_OBJECT:
+                if char == "{":
+                    self.state = EXPECT_KEY
+
+            elif state == EXPECT_KEY:
+                if char == '"':
+                    self.state = IN_KEY
+                elif char == "}":
+                    self.state = DONE
+
+            elif state == IN_KEY:
+                if self.escaped:
+                    self.escaped = False
+                    self.key.append(char)
+                elif char == "\\":
+                    self.escaped = True
+                    self.key.append(char)
+                elif char == '"':
+                    self.current_key = json.loads('"' + "".join(self.key) + '"')
+                    self.key = []
+                    self.state = EXPECT_COLON
+                else:
+                    self.key.append(char)
+
+            elif state == EXPECT_COLON:
+                if char == ":":
+                    self.state = EXPECT_VALUE
+
+            elif state == EXPECT_VALUE:
+                if char in WHITESPACE:
+                    continue
+                self.state = IN_VALUE
+                self.value.append(char)
+                if char == '"':
+                    self.in_string = True
+                elif char in "{[":
+                    self.depth = 1
+
+            elif state == IN_VALUE:
+                if self.in_string:
+                    self.value.append(char)
+                    if self.escaped:
+                        self.escaped = False
+                    elif char == "\\":
+                        self.escaped = True
+                    elif char == '"':
+                        self.in_string = False
+                        if self.depth == 0:
+                            fields.append(self._finish_value())
+                elif self.depth:
+                    self.value.append(char)
+                    if char == '"':
+                        self.in_string = True
+                    elif char in "{[":
+                        self.depth += 1
+                    elif char in "}]":
+                        self.depth -= 1
+                        if self.depth == 0:
+                            fields.append(self._finish_value())
+                elif char in ",}" or char in WHITESPACE:
+                    fields.append(self._finish_value())
+                    if char == ",":
+                        self.state = EXPECT_KEY
+                    elif char == "}":
+                        self.state = DONE
+                else:
+                    self.value.append(char)
+
+            elif state == AFTER_VALUE:
+                if char == ",":
+                    self.state = EXPECT_KEY
+                elif char == "}":
+                    self.state = DONE
+
+        return fields
+
+    @property
+    def done(self):
+        return self.state == DONE
+
+
+def _stream_fields(chunks):
+    parser = IncrementalJsonParser()
+
+    for chunk in chunks:
+        text = chunk if isinstance(chunk, str) else chunk.content
+        for key, value in parser.feed(text):
+            yield AddableDict({key: value})
+
+        if parser.done:
+            break
+
+    if not parser.done:
+        # Fields already yielded stay valid, but the object itself never closed.
+        raise OutputParserException("Stream ended before the JSON object was closed.")
+
+
+StreamingJsonOutputParser = RunnableGenerator(_stream_fields)
@@ -2,6 +2,7 @@ from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.prompts import PromptTemplate
 from langchain.output_parsers import StructuredOutputParser, ResponseSchema
 from dotenv import load_dotenv
+from streaming_json_parser import StreamingJsonOutputParser
 
 load_dotenv()
 
@@ -27,8 +28,7 @@ template = PromptTemplate(
 
 # parsed_result = parser.parse(result.content)
 
-chain = template | model | parser
+chain = template | model | StreamingJsonOutputParser
 
-result = chain.invoke({"database": "Swiss-prot"})
-
-print(result)
\ No newline at end of file
+for field in chain.stream({"database": "Swiss-prot"}):
+    print(field)
\ No newline at end of file
@@ -0,0 +1,155 @@
+import asyncio
+import csv
+import hashlib
+import json
+import logging
+import sqlite3
+
+logger = logging.getLogger(__name__)
+
+
+def read_inputs(path):
+    if path.endswith(".csv"):
+        with open(path, "r", newline="", encoding="utf-8") as f:
+            yield from csv.DictReader(f)
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+
+
+def item_id(item):
+    return hashlib.sha256(json.dumps(item, sort_keys=True).encode("utf-8")).hexdigest()[:32]
+
+
+class CheckpointStore:
+    def __init__(self, path):
+        self.db = sqlite3.connect(path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "item_id TEXT, stage INTEGER, output TEXT, PRIMARY KEY (item_id, stage))"
+        )
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS failures (item_id TEXT PRIMARY KEY, item TEXT, stage INTEGER, error TEXT)"
+        )
+        self.db.commit()
+
+    def completed(self, item_id):
+        rows = self.db.execute("SELECT stage, output FROM results WHERE item_id = ?", (item_id,)).fetchall()
+        return {stage: json.loads(output) for stage, output in rows}
+
+    def save(self, item_id, stage, output):
+        self.db.execute(
+            "INSERT OR REPLACE INTO results (item_id, stage, output) VALUES (?, ?, ?)",
+            (item_id, stage, json.dumps(output)),
+        )
+        self.db.commit()
+
+    def record_failure(self, item_id, item, stage, error):
+        self.db.execute(
+            "INSERT OR REPLACE INTO failures (item_id, item, stage, error) VALUES (?, ?, ?, ?)",
+            (item_id, json.dumps(item), stage, repr(error)),
+        )
+        self.db.commit()
+
+    def clear_failure(self, item_id):
+        self.db.execute("DELETE FROM failures WHERE item_id = ?", (item_id,))
+        self.db.commit()
+
+    def failures(self):
+        rows = self.db.execute("SELECT item_id, item, stage, error FROM failures ORDER BY rowid").fetchall()
+        return [
+            {"item_id": key, "item": json.loads(item), "stage": stage, "error": error}
+            for key, item, stage, error in rows
+        ]
+
+    def close(self):
+        self.db.close()
+
+
+class BatchRunner:
+    """Runs a multi-stage chain over a stream of inputs with per-stage checkpoints.
+
+    Each stage is a runnable whose output feeds the next one. Items move
+    through the stages independently, so a stage-2 call starts as soon as that
+    item's stage-1 result lands. Every stage result is written to SQLite, and a
+    re-run skips stages that already finished. Use `max_concurrency` to bound
+    the in-flight calls per stage.
+
+    A failed item is logged with its id, stage and error and kept in the
+    checkpoint's `failures` table until it succeeds; `failed_items()` yields
+    those items so a later `run(runner.failed_items())` retries only them,
+    resuming from the stage that failed.
+    """
+
+    def __init__(self, stages, checkpoint_path="batch_checkpoints.sqlite", max_concurrency=16, max_pending=1000):
+        self.stages = stages
+        self.store = CheckpointStore(checkpoint_path)
+        self.max_concurrency = max_concurrency
+        self.max_pending = max_pending
+        self.semaphores = []
+        self.stats = {}
+
+    async def _run_item(self, item):
+        key = item_id(item)
+        done = self.store.completed(key)
+        value = item
+
+        for stage_index, stage in enumerate(self.stages):
+            if stage_index in done:
+                value = done[stage_index]
+                self.stats["stage_skips"] += 1
+                continue
+
+            try:
+                async with self.semaphores[stage_index]:
+                    value = await stage.ainvoke(value)
+                # Saving can fail too (e.g. output that isn't JSON-serializable).
+                self.store.save(key, stage_index, value)
+            except Exception as error:
+                logger.warning("Item %s failed at stage %d: %r", key, stage_index, error)
+                self.store.record_failure(key, item, stage_index, error)
+                raise
+
+            self.stats["stage_calls"] += 1
+
+        self.store.clear_failure(key)
+        self.stats["items"] += 1
+        return item, value
+
+    def failures(self):
+        return self.store.failures()
+
+    def failed_items(self):
+        return [failure["item"] for failure in self.store.failures()]
+
+    async def run(self, inputs, on_result=None):
+        # Semaphores bind to the loop that first waits on them, so each run
+        # (each asyncio.run) gets its own; stats are per run as well.
+        self.semaphores = [asyncio.Semaphore(self.max_concurrency) for _ in self.stages]
+        self.stats = {"items": 0, "stage_calls": 0, "stage_skips": 0, "failures": 0}
+        pending = set()
+
+        async def drain(return_when):
+            nonlocal pending
+            finished, pending = await asyncio.wait(pending, return_when=return_when)
+            for task in finished:
+                if task.exception() is not None:
+                    self.stats["failures"] += 1
+                elif on_result is not None:
+                    on_result(*task.result())
+
+        for item in inputs:
+            pending.add(asyncio.create_task(self._run_item(item)))
+            if len(pending) >= self.max_pending:
+                await drain(asyncio.FIRST_COMPLETED)
+
+        if pending:
+            await drain(asyncio.ALL_COMPLETED)
+
+        return self.stats
+
+    def close(self):
+        self.store.close()
@@ -0,0 +1,44 @@
+import asyncio
+from langchain_google_genai import ChatGoogleGenerativeAI
+from langchain_core.prompts import PromptTemplate
+from langchain_core.output_parsers import StrOutputParser
+from dotenv import load_dotenv
+from batch_runner import BatchRunner, read_inputs
+
+load_dotenv()
+
+model = ChatGoogleGenerativeAI(model="gemini-1.5-pro")
+
+parser = StrOutputParser()
+
+report_prompt = PromptTemplate(
+    template="Genertae a report on {topic}.",
+    input_variables=["topic"]
+)
+
+summary_prompt  = PromptTemplate(
+    template="Generate a 5 pointer summary from the following text: \n {text}.",
+    input_variables=["text"]
+)
+
+runner = BatchRunner(
+    stages=[report_prompt | model | parser, summary_prompt | model | parser],
+    checkpoint_path="sequential_chain_checkpoints.sqlite",
+    max_concurrency=16,
+)
+
+def print_result(item, summary):
+    print(f"{item['topic']}:\n{summary}\n")
+
+# topics.jsonl holds one {"topic": "..."} object per line; a CSV with a "topic" column works too.
+stats = asyncio.run(runner.run(read_inputs("topics.jsonl"), on_result=print_result))
+
+# Failed items are kept in the checkpoint; retry only those, from the stage that failed.
+for failure in runner.failures():
+    print(f"failed at stage {failure['stage']}: {failure['item']} ({failure['error']})")
+if stats["failures"]:
+    stats = asyncio.run(runner.run(runner.failed_items(), on_result=print_result))
+
+runner.close()
+
+print(stats)
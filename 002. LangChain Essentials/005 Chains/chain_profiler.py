@@ -0,0 +1,227 @@
+import json
+import time
+from collections import defaultdict
+
+import numpy as np
+from langchain_core.callbacks import BaseCallbackHandler
+from langchain_core.runnables import Runnable, RunnableParallel, RunnableSequence
+from langchain_core.runnables.graph_ascii import draw_ascii
+
+POSITION_TAGS = ("seq:step:", "map:key:")
+
+
+def _position(tags):
+    positions = [tag.split(":", 2)[2] for tag in tags or [] if tag.startswith(POSITION_TAGS)]
+    return positions[-1] if positions else None
+
+
+def _leaf_positions(runnable, positions=()):
+    if isinstance(runnable, RunnableSequence):
+        for i, step in enumerate(runnable.steps, 1):
+            yield from _leaf_positions(step, positions + (str(i),))
+    elif isinstance(runnable, RunnableParallel):
+        for key, step in runnable.steps__.items():
+            yield from _leaf_positions(step, positions + (key,))
+    else:
+        yield runnable, positions
+
+
+class ChainProfiler(BaseCallbackHandler):
+    """Callback that profiles every node of a Runnable graph.
+
+    For each run it records wall time, queueing time (gap between the node
+    becoming ready and actually starting), tokens in/out and time to first
+    token. Results are aggregated per graph position into p50/p95/p99: a
+    node is identified by the path of `seq:step:N` / `map:key:K` positions
+    from the root run, so the two model calls in `prompt | model | parser |
+    prompt | model | parser` are reported separately. Results can be
+    exported as a Chrome trace (chrome://tracing, Perfetto, speedscope) or
+    drawn onto `chain.get_graph()`.
+    """
+
+    def __init__(self):
+        self.runs = {}
+        self.last_child_end = {}
+        self.lanes = 0
+
+    def _start(self, run_id, parent_run_id, name, tags):
+        now = time.perf_counter()
+        parent = self.runs.get(parent_run_id)
+        position = _position(tags)
+        segment = name if position is None else f"{position}:{name}"
+
+        if parent is None:
+            ready = now
+            lane = self._new_lane()
+            path = segment
+            positions = ()
+        else:
+            ready = max(parent["start"], self.last_child_end.get(parent_run_id, parent["start"]))
+            lane = self._new_lane() if parent["name"].startswith("RunnableParallel") else parent["lane"]
+            path = f"{parent['path']}/{segment}"
+            positions = parent["positions"] + (position or name,)
+
+        self.runs[run_id] = {
+            "name": name,
+            "path": path,
+            "positions": positions,
+            "parent": parent_run_id,
+            "lane": lane,
+            "start": now,
+            "queue": max(0.0, now - ready),
+            "end": None,
+            "first_token": None,
+            "tokens_in": 0,
+            "tokens_out": 0,
+        }
+
+    def _new_lane(self):
+        self.lanes += 1
+        return self.lanes
+
+    def _end(self, run_id):
+        run = self.runs.get(run_id)
+        if run is None:
+            return None
+
+        run["end"] = time.perf_counter()
+        if run["parent"] is not None:
+            self.last_child_end[run["parent"]] = run["end"]
+        return run
+
+    @staticmethod
+    def _name(serialized, kwargs):
+        if kwargs.get("name"):
+            return kwargs["name"]
+        if serialized:
+            return serialized.get("name") or serialized.get("id", ["Runnable"])[-1]
+        return "Runnable"
+
+    def on_chain_start(self, serialized, inputs, *, run_id, parent_run_id=None, tags=None, **kwargs):
+        self._start(run_id, parent_run_id, self._name(serialized, kwargs), tags)
+
+    def on_chain_end(self, outputs, *, run_id, **kwargs):
+        self._end(run_id)
+
+    def on_chain_error(self, error, *, run_id, **kwargs):
+        self._end(run_id)
+
+    def on_chat_model_start(self, serialized, messages, *, run_id, parent_run_id=None, tags=None, **kwargs):
+        self._start(run_id, parent_run_id, self._name(serialized, kwargs), tags)
+
+    def on_llm_start(self, serialized, prompts, *, run_id, parent_run_id=None, tags=None, **kwargs):
+        self._start(run_id, parent_run_id, self._name(serialized, kwargs), tags)
+
+    def on_llm_new_token(self, token, *, run_id, **kwargs):
+        run = self.runs.get(run_id)
+        if run is not None and run["first_token"] is None:
+            run["first_token"] = time.perf_counter()
+
+    def on_llm_end(self, response, *, run_id, **kwargs):
+        run = self._end(run_id)
+        if run is None:
+            return
+
+        usage = (response.llm_output or {}).get("token_usage") or {}
+        tokens_in = usage.get("prompt_tokens", 0)
+        tokens_out = usage.get("completion_tokens", 0)
+
+        if not usage:
+            for generations in response.generations:
+                for generation in generations:
+                    metadata = getattr(getattr(generation, "message", None), "usage_metadata", None) or {}
+                    tokens_in += metadata.get("input_tokens", 0)
+                    tokens_out += metadata.get("output_tokens", 0)
+
+        run["tokens_in"] = tokens_in
+        run["tokens_out"] = tokens_out
+
+    def on_llm_error(self, error, *, run_id, **kwargs):
+        self._end(run_id)
+
+    def summary(self, key="path"):
+        per_node = defaultdict(lambda: defaultdict(list))
+
+        for run in self.runs.values():
+            if run["end"] is None:
+                continue
+            stats = per_node[run[key]]
+            stats["wall"].append(run["end"] - run["start"])
+            stats["queue"].append(run["queue"])
+            stats["tokens_in"].append(run["tokens_in"])
+            stats["tokens_out"].append(run["tokens_out"])
+            if run["first_token"] is not None:
+                stats["ttft"].append(run["first_token"] - run["start"])
+
+        summary = {}
+        for name, stats in per_node.items():
+            summary[name] = {"calls": len(stats["wall"])}
+            for metric in ("wall", "queue", "ttft"):
+                if stats[metric]:
+                    p50, p95, p99 = np.percentile(stats[metric], [50, 95, 99])
+                    summary[name][metric] = {"p50": p50, "p95": p95, "p99": p99}
+            summary[name]["tokens_in"] = int(sum(stats["tokens_in"]))
+            summary[name]["tokens_out"] = int(sum(stats["tokens_out"]))
+
+        return summary
+
+    def export_chrome_trace(self, path="chain_trace.json"):
+        finished = [run for run in self.runs.values() if run["end"] is not None]
+        if not finished:
+            events = []
+        else:
+            origin = min(run["start"] for run in finished)
+            events = [
+                {
+                    "name": run["name"],
+                    "ph": "X",
+                    "pid": 1,
+                    "tid": run["lane"],
+                    "ts": (run["start"] - origin) * 1e6,
+                    "dur": (run["end"] - run["start"]) * 1e6,
+                    "args": {
+                        "path": run["path"],
+                        "queue_ms": run["queue"] * 1e3,
+                        "tokens_in": run["tokens_in"],
+                        "tokens_out": run["tokens_out"],
+                        "ttft_ms": None if run["first_token"] is None else (run["first_token"] - run["start"]) * 1e3,
+                    },
+                }
+                for run in finished
+            ]
+
+        with open(path, "w") as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f)
+
+    def annotated_graph(self, chain):
+        graph = chain.get_graph()
+        summary = self.summary(key="positions")
+
+        # Graph nodes for runnables appear in the same order as the leaves of
+        # the chain's sequences and parallels, which gives each its position.
+        leaves = iter(_leaf_positions(chain))
+        node_positions = {}
+        for node in graph.nodes.values():
+            if isinstance(node.data, Runnable):
+                runnable, positions = next(leaves, (None, None))
+                if runnable is not node.data:
+                    node_positions = {}
+                    break
+                node_positions[node.id] = positions
+
+        labels = {}
+        for node in graph.nodes.values():
+            stats = summary.get(node_positions.get(node.id))
+            if stats and "wall" in stats:
+                wall = stats["wall"]
+                label = f"{node.name} p50={wall['p50'] * 1e3:.0f}ms p95={wall['p95'] * 1e3:.0f}ms"
+                if stats["tokens_in"] or stats["tokens_out"]:
+                    label += f" tok={stats['tokens_in']}/{stats['tokens_out']}"
+                labels[node.id] = label
+            else:
+                labels[node.id] = node.name
+
+        return draw_ascii(labels, graph.edges)
+
+    def print_annotated_graph(self, chain):
+        print(self.annotated_graph(chain))
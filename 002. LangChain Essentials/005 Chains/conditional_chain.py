@@ -3,6 +3,7 @@ from langchain_core.prompts import PromptTemplate
 from langchain_core.output_parsers import StrOutputParser, PydanticOutputParser
 from langchain.schema.runnable import RunnableBranch, RunnableLambda
 from dotenv import load_dotenv
+from local_router import LocalRouter
 from pydantic import BaseModel, Field
 from typing import Literal
 load_dotenv()
@@ -15,7 +16,7 @@ class Feedback(BaseModel):
     sentiment: Literal["positive", "negative"] = Field(description="Feedback sentiment")
 
 
-pydantic_parser = PydanticOutputParser(Feedback)
+pydantic_parser = PydanticOutputParser(pydantic_object=Feedback)
 
 prompt_for_classification = PromptTemplate(
     template="Classify the sentiment of the following feedback text into poisitve or negative: \n {feedback} \n {format_instruction}",
@@ -23,7 +24,12 @@ prompt_for_classification = PromptTemplate(
     partial_variables={"format_instruction": pydantic_parser.get_format_instructions()}
 )
 
-classifier_chain = prompt_for_classification | model | parser
+classifier_chain = prompt_for_classification | model | pydantic_parser
+
+router = LocalRouter(
+    llm_classifier=lambda feedback: classifier_chain.invoke({"feedback": feedback}).sentiment,
+    threshold=0.9,
+)
 
 pos_prompt = PromptTemplate(
     template="Write an appropriate response for this positove feedback: \n {feedback}",
@@ -41,8 +47,10 @@ branch_chain = RunnableBranch(
     RunnableLambda(lambda x: "Unable to find sentiment.")
 )
 
-chain = classifier_chain | branch_chain
+chain = router.as_runnable() | branch_chain
 
 result = chain.invoke({"feedback": "Powerful, interdisciplinary, data-driven, evolving, impactful."})
 
-print(result)
\ No newline at end of file
+print(result)
+
+router.export_metrics()
\ No newline at end of file
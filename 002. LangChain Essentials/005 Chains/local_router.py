@@ -0,0 +1,134 @@
+import json
+import os
+import random
+from collections import Counter
+
+import numpy as np
+from langchain_core.runnables import RunnableLambda
+from sklearn.feature_extraction.text import HashingVectorizer
+from sklearn.linear_model import LogisticRegression
+
+
+class LocalRouter:
+    """Local pre-classifier that answers easy routing decisions before the LLM classifier.
+
+    A logistic regression is trained on past routed traffic (text, label) stored
+    in `examples_path`. Inputs whose top probability reaches `threshold` are
+    routed locally; the rest are escalated to `llm_classifier` and its answer
+    becomes a new training example. `audit_rate` sends a sample of confident
+    inputs to the LLM as well so the agreement rate stays measurable.
+
+    By default texts are featurized with a hashing vectorizer, which keeps a
+    decision well under a millisecond; pass `embed` (e.g. a cached
+    `embed_documents`) to train on embeddings instead.
+    """
+
+    def __init__(self, llm_classifier, examples_path="router_examples.jsonl", threshold=0.9,
+                 embed=None, min_examples=20, retrain_every=50, audit_rate=0.02):
+        self.llm_classifier = llm_classifier
+        self.examples_path = examples_path
+        self.threshold = threshold
+        self.min_examples = min_examples
+        self.retrain_every = retrain_every
+        self.audit_rate = audit_rate
+
+        if embed is None:
+            vectorizer = HashingVectorizer(analyzer="char_wb", ngram_range=(2, 4), n_features=2**18, alternate_sign=False)
+            embed = vectorizer.transform
+        self.embed = embed
+
+        self.classifier = None
+        self.texts = []
+        self.labels = []
+        self.new_examples = 0
+
+        self.route_counts = Counter()
+        self.confidence_histogram = np.zeros(10, dtype=np.int64)
+        self.agreement = Counter()
+
+        self._load_examples()
+        self.train()
+
+    def _load_examples(self):
+        if not os.path.exists(self.examples_path):
+            return
+
+        with open(self.examples_path, "r", encoding="utf-8") as f:
+            for line in f:
+                example = json.loads(line)
+                self.texts.append(example["text"])
+                self.labels.append(example["label"])
+
+    def _add_example(self, text, label):
+        self.texts.append(text)
+        self.labels.append(label)
+        self.new_examples += 1
+
+        with open(self.examples_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps({"text": text, "label": label}) + "\n")
+
+        if self.new_examples >= self.retrain_every:
+            self.train()
+
+    def train(self):
+        self.new_examples = 0
+        if len(self.texts) < self.min_examples or len(set(self.labels)) < 2:
+            return
+
+        classifier = LogisticRegression(max_iter=1000)
+        classifier.fit(self.embed(self.texts), self.labels)
+        self.classifier = classifier
+
+    def predict(self, text):
+        if self.classifier is None:
+            return None, 0.0
+
+        probabilities = self.classifier.predict_proba(self.embed([text]))[0]
+        best = int(np.argmax(probabilities))
+        return self.classifier.classes_[best], float(probabilities[best])
+
+    def route(self, text):
+        label, confidence = self.predict(text)
+        if label is not None:
+            self.confidence_histogram[min(int(confidence * 10), 9)] += 1
+
+        confident = label is not None and confidence >= self.threshold
+        if confident and random.random() >= self.audit_rate:
+            self.route_counts[f"local:{label}"] += 1
+            return label
+
+        llm_label = self.llm_classifier(text)
+        self.route_counts[f"llm:{llm_label}"] += 1
+
+        if label is not None:
+            bucket = "confident" if confident else "escalated"
+            self.agreement[f"{bucket}_total"] += 1
+            self.agreement[f"{bucket}_agree"] += int(label == llm_label)
+
+        self._add_example(text, llm_label)
+        return llm_label
+
+    def metrics(self):
+        rates = {
+            bucket: self.agreement[f"{bucket}_agree"] / self.agreement[f"{bucket}_total"]
+            for bucket in ("confident", "escalated")
+            if self.agreement[f"{bucket}_total"]
+        }
+        local = sum(count for route, count in self.route_counts.items() if route.startswith("local:"))
+        total = sum(self.route_counts.values())
+
+        return {
+            "threshold": self.threshold,
+            "route_counts": dict(self.route_counts),
+            "local_rate": local / total if total else 0.0,
+            "confidence_histogram": {f"{i / 10:.1f}-{(i + 1) / 10:.1f}": int(c) for i, c in enumerate(self.confidence_histogram)},
+            "agreement_rates": rates,
+            "training_examples": len(self.texts),
+        }
+
+    def export_metrics(self, path="router_metrics.json"):
+        with open(path, "w") as f:
+            json.dump(self.metrics(), f, indent=2)
+
+    def as_runnable(self, input_key="feedback", output_key="sentiment"):
+        return RunnableLambda(lambda x: {**x, output_key: self.route(x[input_key])})
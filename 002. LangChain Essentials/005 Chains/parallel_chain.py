@@ -1,3 +1,4 @@
+import asyncio
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_openai import ChatOpenAI
 from langchain_anthropic import ChatAnthropic
@@ -5,6 +6,7 @@ from langchain_core.prompts import PromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 from langchain.schema.runnable import RunnableParallel
 from dotenv import load_dotenv
+from provider_scheduler import ProviderScheduler
 
 load_dotenv()
 
@@ -32,6 +34,8 @@ model_for_notes = ChatGoogleGenerativeAI(model="gemini-1.5-pro")
 model_for_quiz = ChatAnthropic(model="claude-3.5-sonnet-20241022")
 final_model = ChatOpenAI(model="gpt-4")
 
+scheduler = ProviderScheduler()
+
 parser = StrOutputParser()
 
 prompt_for_notes = PromptTemplate(
@@ -50,14 +54,17 @@ final_prompt = PromptTemplate(
 )
 
 parallel_chain = RunnableParallel({
-    "notes": prompt_for_notes | model_for_notes | parser,
-    "quiz": prompt_for_quiz | model_for_quiz | parser
+    "notes": prompt_for_notes | scheduler.wrap(model_for_notes) | parser,
+    "quiz": prompt_for_quiz | scheduler.wrap(model_for_quiz) | parser
 })
 
-merge_chain = final_prompt | final_model | parser
+merge_chain = final_prompt | scheduler.wrap(final_model) | parser
 
 chain = parallel_chain | merge_chain
 
-result = chain.invoke({"text": text})
+# chain.invoke works too; ainvoke lets the two branches share one event loop.
+result = asyncio.run(chain.ainvoke({"text": text}))
+
+print(result)
 
-print(result)
\ No newline at end of file
+scheduler.close()
\ No newline at end of file
@@ -0,0 +1,191 @@
+import asyncio
+import threading
+import time
+from dataclasses import dataclass
+
+from langchain_core.runnables import RunnableLambda
+
+PROVIDERS = {
+    "ChatGoogleGenerativeAI": "google",
+    "ChatAnthropic": "anthropic",
+    "ChatOpenAI": "openai",
+    "ChatHuggingFace": "huggingface",
+}
+
+
+def provider_of(model):
+    return PROVIDERS.get(type(model).__name__, type(model).__name__)
+
+
+def is_rate_limited(error):
+    status = getattr(error, "status_code", None) or getattr(getattr(error, "response", None), "status_code", None)
+    if status == 429:
+        return True
+    message = str(error).lower()
+    return "429" in message or "rate limit" in message or "resource exhausted" in message
+
+
+@dataclass
+class ProviderLimits:
+    requests_per_second: float = 5.0
+    burst: int = 10
+    initial_concurrency: int = 4
+    min_concurrency: int = 1
+    max_concurrency: int = 64
+    latency_target: float = 30.0
+    max_retries: int = 5
+
+
+class TokenBucket:
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self.lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self.lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class ProviderLimiter:
+    """Per-provider concurrency gate with a token bucket and AIMD-adapted limit.
+
+    The concurrency limit grows additively after successful calls that finish
+    within `latency_target`, and is halved on every rate-limit (429) error.
+    """
+
+    def __init__(self, limits):
+        self.limits = limits
+        self.bucket = TokenBucket(limits.requests_per_second, limits.burst)
+        self.limit = float(limits.initial_concurrency)
+        self.in_flight = 0
+        self.condition = asyncio.Condition()
+        self.stats = {"calls": 0, "rate_limited": 0, "retries": 0}
+
+    async def _enter(self):
+        async with self.condition:
+            await self.condition.wait_for(lambda: self.in_flight < int(self.limit))
+            self.in_flight += 1
+
+    async def _exit(self):
+        async with self.condition:
+            self.in_flight -= 1
+            self.condition.notify_all()
+
+    def _on_success(self, latency):
+        if latency > self.limits.latency_target:
+            self.limit = max(self.limits.min_concurrency, self.limit * 0.9)
+        else:
+            self.limit = min(self.limits.max_concurrency, self.limit + 1 / self.limit)
+
+    def _on_rate_limit(self):
+        self.limit = max(self.limits.min_concurrency, self.limit / 2)
+
+    async def call(self, func, *args):
+        for attempt in range(self.limits.max_retries + 1):
+            await self._enter()
+            try:
+                await self.bucket.acquire()
+                start = time.monotonic()
+                result = await func(*args)
+                self.stats["calls"] += 1
+                self._on_success(time.monotonic() - start)
+                return result
+            except Exception as error:
+                if not is_rate_limited(error) or attempt == self.limits.max_retries:
+                    raise
+                self.stats["rate_limited"] += 1
+                self.stats["retries"] += 1
+                self._on_rate_limit()
+            finally:
+                await self._exit()
+
+            await asyncio.sleep(min(30.0, 2 ** attempt))
+
+
+class ProviderScheduler:
+    """Routes model calls through one limiter per provider on a shared event loop.
+
+    Wrap each model with `scheduler.wrap(model)`: branches that hit different
+    providers no longer wait on each other, and each provider's throughput
+    follows its own limits. The limiters live on the scheduler's own event
+    loop thread, so the wrapped model works from `invoke`/`batch` as well as
+    `ainvoke`/`abatch`, and across separate `asyncio.run` calls. Call
+    `close()` to stop the loop thread: calls still in flight are cancelled,
+    and the limiters (and their stats) are dropped so that later calls start
+    a fresh loop with fresh limiters.
+    """
+
+    def __init__(self, limits=None, default_limits=None):
+        self.limits = limits or {}
+        self.default_limits = default_limits or ProviderLimits()
+        self.limiters = {}
+        self._loop = None
+        self._thread = None
+        self._loop_lock = threading.Lock()
+
+    def _submit(self, coroutine):
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, daemon=True)
+                self._thread.start()
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+
+    async def _call(self, provider, model, prompt, config):
+        return await self.limiter(provider).call(model.ainvoke, prompt, config)
+
+    def limiter(self, provider):
+        if provider not in self.limiters:
+            self.limiters[provider] = ProviderLimiter(self.limits.get(provider, self.default_limits))
+        return self.limiters[provider]
+
+    def wrap(self, model, provider=None):
+        provider = provider or provider_of(model)
+
+        def call_model(prompt, config):
+            return self._submit(self._call(provider, model, prompt, config)).result()
+
+        async def acall_model(prompt, config):
+            return await asyncio.wrap_future(self._submit(self._call(provider, model, prompt, config)))
+
+        return RunnableLambda(call_model, afunc=acall_model, name=f"{provider}:{type(model).__name__}")
+
+    def stats(self):
+        return {
+            provider: {**limiter.stats, "concurrency": round(limiter.limit, 2)}
+            for provider, limiter in self.limiters.items()
+        }
+
+    @staticmethod
+    async def _cancel_pending():
+        tasks = [task for task in asyncio.all_tasks() if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    def close(self):
+        with self._loop_lock:
+            if self._loop is None:
+                return
+            # Cancelling the tasks also cancels the futures that sync and async
+            # callers are waiting on, so nobody is left blocked on a dead loop.
+            asyncio.run_coroutine_threadsafe(self._cancel_pending(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+            self._loop = None
+            self._thread = None
+            # The limiters' locks and conditions belong to the closed loop.
+            self.limiters = {}
@@ -2,6 +2,7 @@ from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.prompts import PromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 from dotenv import load_dotenv
+from chain_profiler import ChainProfiler
 
 load_dotenv()
 
@@ -21,8 +22,12 @@ summary_prompt  = PromptTemplate(
 
 chain = report_prompt | model | parser | summary_prompt | model | parser
 
-result = chain.invoke({"topic": "AI in CRISPR technology"})
+profiler = ChainProfiler()
+
+result = chain.invoke({"topic": "AI in CRISPR technology"}, config={"callbacks": [profiler]})
 
 print(result)
 
-chain.get_graph().print_ascii()
\ No newline at end of file
+profiler.print_annotated_graph(chain)
+
+profiler.export_chrome_trace("chain_trace.json")
\ No newline at end of file
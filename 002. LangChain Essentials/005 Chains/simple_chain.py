@@ -2,6 +2,7 @@ from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.prompts import PromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 from dotenv import load_dotenv
+from chain_profiler import ChainProfiler
 
 load_dotenv()
 
@@ -16,8 +17,12 @@ prompt = template = PromptTemplate(
 
 chain = prompt | model | parser
 
-result = chain.invoke({"topic": "CRISPR"})
+profiler = ChainProfiler()
+
+result = chain.invoke({"topic": "CRISPR"}, config={"callbacks": [profiler]})
 
 print(result)
 
-chain.get_graph().print_ascii()
\ No newline at end of file
+profiler.print_annotated_graph(chain)
+
+profiler.export_chrome_trace("chain_trace.json")
\ No newline at end of file
@@ -0,0 +1,121 @@
+import re
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+
+from langchain_core.language_models import BaseLanguageModel
+from langchain_core.messages import AIMessage
+from langchain_core.prompts import BasePromptTemplate
+from langchain_core.runnables import Runnable, RunnableSequence
+from langchain_core.runnables.base import coerce_to_runnable
+
+PACK_INSTRUCTIONS = (
+    "Complete each of the following independent tasks. Answer every task under its own "
+    "'### Answer N' heading, in order, and write nothing outside those sections."
+)
+ANSWER_HEADING = re.compile(r"^###\s*Answer\s+(\d+)\s*$", re.MULTILINE)
+
+
+def _split_branch(branch):
+    if not isinstance(branch, RunnableSequence):
+        return None
+
+    steps = branch.steps
+    if len(steps) < 2 or not isinstance(steps[0], BasePromptTemplate) or not isinstance(steps[1], BaseLanguageModel):
+        return None
+
+    rest = steps[2:]
+    post = None
+    if len(rest) == 1:
+        post = rest[0]
+    elif rest:
+        post = RunnableSequence(*rest)
+
+    return steps[0], steps[1], post
+
+
+def pack_prompts(prompts):
+    tasks = "\n\n".join(f"### Task {i}\n{prompt.to_string()}" for i, prompt in enumerate(prompts, 1))
+    return f"{PACK_INSTRUCTIONS}\n\n{tasks}"
+
+
+def unpack_answers(text, count):
+    headings = list(ANSWER_HEADING.finditer(text))
+    if [int(h.group(1)) for h in headings] != list(range(1, count + 1)):
+        return None
+
+    ends = [h.start() for h in headings[1:]] + [len(text)]
+    return [text[h.end():end].strip() for h, end in zip(headings, ends)]
+
+
+class BatchedParallel(Runnable):
+    """Drop-in RunnableParallel that merges sibling branches calling the same model.
+
+    Branches shaped like `prompt | model | ...` are grouped by model instance.
+    Each group renders its prompts, sends them to the model together and
+    scatters the results back through each branch's remaining steps.
+
+    mode="pack" (the default) puts all prompts in a single request with
+    numbered sections and splits the answer, so a group costs one round-trip
+    with any chat model; if the answer cannot be split it falls back to
+    `model.batch`. mode="batch" only calls `model.batch`. Most chat models
+    inherit Runnable.batch, which is one request per prompt run on a thread
+    pool, so this saves no calls over RunnableParallel unless the model
+    overrides `batch` with a real provider batch endpoint. Branches are
+    coerced like RunnableParallel's (lambdas, dicts), and other branches run
+    concurrently as usual.
+    """
+
+    def __init__(self, branches, mode="pack"):
+        branches = {key: coerce_to_runnable(branch) for key, branch in branches.items()}
+        self.branches = branches
+        self.mode = mode
+
+        groups = defaultdict(list)
+        self.plain = {}
+        for key, branch in branches.items():
+            split = _split_branch(branch)
+            if split is None:
+                self.plain[key] = branch
+            else:
+                groups[id(split[1])].append((key, *split))
+
+        self.groups = []
+        for members in groups.values():
+            if len(members) == 1:
+                key = members[0][0]
+                self.plain[key] = branches[key]
+            else:
+                self.groups.append(members)
+
+    def _call_model(self, model, prompts, config):
+        if self.mode == "pack":
+            response = model.invoke(pack_prompts(prompts), config)
+            answers = unpack_answers(getattr(response, "content", response), len(prompts))
+            if answers is not None:
+                return [AIMessage(content=answer) for answer in answers]
+
+        return model.batch(prompts, config)
+
+    def _run_group(self, members, input, config):
+        model = members[0][2]
+        prompts = [prompt.invoke(input, config) for _, prompt, _, _ in members]
+        outputs = self._call_model(model, prompts, config)
+
+        return {
+            key: post.invoke(output, config) if post is not None else output
+            for (key, _, _, post), output in zip(members, outputs)
+        }
+
+    def invoke(self, input, config=None, **kwargs):
+        results = {}
+
+        with ThreadPoolExecutor(max_workers=len(self.plain) + len(self.groups) or 1) as pool:
+            plain = {key: pool.submit(branch.invoke, input, config) for key, branch in self.plain.items()}
+            grouped = [pool.submit(self._run_group, members, input, config) for members in self.groups]
+
+            for key, future in plain.items():
+                results[key] = future.result()
+            for future in grouped:
+                results.update(future.result())
+
+        return {key: results[key] for key in self.branches}
@@ -0,0 +1,58 @@
+import time
+from langchain_core.prompts import PromptTemplate
+from langchain_core.output_parsers import StrOutputParser
+from langchain.schema.runnable import RunnableSequence, RunnableParallel
+from batched_parallel import BatchedParallel
+from stub_model_server import StubModelServer, StubChatModel
+
+RUNS = 10
+
+parser = StrOutputParser()
+
+prompt_tweet = PromptTemplate(
+    template="Generate a tweet about {topic}",
+    input_variables=["topic"],
+)
+
+prompt_post = PromptTemplate(
+    template="Write a LinkedIn post about {topic}",
+    input_variables=["topic"],
+)
+
+prompt_thread = PromptTemplate(
+    template="Write a short Twitter thread about {topic}",
+    input_variables=["topic"],
+)
+
+with StubModelServer(latency=0.3) as server:
+    # Most chat model integrations have no batch endpoint and inherit
+    # Runnable.batch; a native batch endpoint is shown for comparison.
+    models = {
+        "inherited Runnable.batch": StubChatModel(url=server.url),
+        "native batch endpoint": StubChatModel(url=server.url, native_batch=True),
+    }
+
+    for label, model in models.items():
+        print(label)
+
+        branches = {
+            "tweet": RunnableSequence(prompt_tweet, model, parser),
+            "post": RunnableSequence(prompt_post, model, parser),
+            "thread": RunnableSequence(prompt_thread, model, parser),
+        }
+
+        runners = {
+            "RunnableParallel": RunnableParallel(branches),
+            "BatchedParallel (batch)": BatchedParallel(branches, mode="batch"),
+            "BatchedParallel (pack)": BatchedParallel(branches, mode="pack"),
+        }
+
+        for name, runner in runners.items():
+            server.requests = 0
+            start = time.perf_counter()
+            for i in range(RUNS):
+                result = runner.invoke({"topic": f"AI in cancer research {i}"})
+            elapsed = time.perf_counter() - start
+
+            assert sorted(result) == sorted(branches)
+            print(f"{name:>24} | {server.requests / RUNS:4.1f} round-trips per invoke | {elapsed / RUNS * 1e3:7.1f} ms per invoke")
\ No newline at end of file
@@ -3,6 +3,7 @@ from langchain_core.prompts import PromptTemplate
 from langchain_core.output_parsers import StrOutputParser
 from langchain.schema.runnable import RunnableSequence, RunnableParallel
 from dotenv import load_dotenv
+from batched_parallel import BatchedParallel
 
 load_dotenv()
 
@@ -20,7 +21,7 @@ prompt_post = PromptTemplate(
     input_variables=["topic"],
 )
 
-parallel_chain = RunnableParallel({
+parallel_chain = BatchedParallel({
     "tweet": RunnableSequence(prompt_tweet, model, parser),
     "post": RunnableSequence(prompt_post, model, parser)
 })
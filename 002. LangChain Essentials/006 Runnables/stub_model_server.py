@@ -0,0 +1,110 @@
+import json
+import re
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, List, Optional
+
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage
+from langchain_core.outputs import ChatGeneration, ChatResult
+
+TASK_HEADING = re.compile(r"^###\s*Task\s+(\d+)\s*$", re.MULTILINE)
+
+
+def stub_completion(prompt):
+    tasks = list(TASK_HEADING.finditer(prompt))
+    if not tasks:
+        return f"stub answer to: {prompt[:60]}"
+
+    ends = [t.start() for t in tasks[1:]] + [len(prompt)]
+    return "\n\n".join(
+        f"### Answer {t.group(1)}\nstub answer to: {prompt[t.end():end].strip()[:60]}"
+        for t, end in zip(tasks, ends)
+    )
+
+
+class StubModelServer:
+    """Local HTTP stand-in for a chat model provider with a fixed per-request latency.
+
+    POST /complete takes {"prompt": ...}; POST /batch takes {"prompts": [...]}
+    and answers all of them in one round-trip. `requests` counts round-trips.
+    """
+
+    def __init__(self, latency=0.3, host="127.0.0.1", port=0):
+        self.latency = latency
+        self.requests = 0
+        self.lock = threading.Lock()
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                with server.lock:
+                    server.requests += 1
+                time.sleep(server.latency)
+
+                if self.path == "/batch":
+                    payload = {"completions": [stub_completion(p) for p in body["prompts"]]}
+                else:
+                    payload = {"completion": stub_completion(body["prompt"])}
+
+                data = json.dumps(payload).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer((host, port), Handler)
+        self.url = f"http://{host}:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+def _post(url, payload):
+    request = urllib.request.Request(
+        url, data=json.dumps(payload).encode("utf-8"), headers={"Content-Type": "application/json"}
+    )
+    with urllib.request.urlopen(request) as response:
+        return json.loads(response.read())
+
+
+class StubChatModel(BaseChatModel):
+    """Chat model client for StubModelServer.
+
+    Like most chat model integrations it inherits Runnable.batch (one
+    /complete request per input) unless `native_batch=True`, which sends
+    all inputs to /batch in one round-trip.
+    """
+
+    url: str
+    native_batch: bool = False
+
+    @property
+    def _llm_type(self):
+        return "stub"
+
+    def _generate(self, messages, stop: Optional[List[str]] = None, run_manager: Any = None, **kwargs):
+        prompt = "\n".join(message.content for message in messages)
+        completion = _post(f"{self.url}/complete", {"prompt": prompt})["completion"]
+        return ChatResult(generations=[ChatGeneration(message=AIMessage(content=completion))])
+
+    def batch(self, inputs, config=None, **kwargs):
+        if not self.native_batch:
+            return super().batch(inputs, config, **kwargs)
+
+        prompts = ["\n".join(m.content for m in self._convert_input(i).to_messages()) for i in inputs]
+        completions = _post(f"{self.url}/batch", {"prompts": prompts})["completions"]
+        return [AIMessage(content=completion) for completion in completions]
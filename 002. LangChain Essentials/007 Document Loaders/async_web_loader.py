@@ -0,0 +1,134 @@
+import asyncio
+import hashlib
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from urllib.parse import urlparse
+
+import aiohttp
+from bs4 import BeautifulSoup
+from langchain_core.document_loaders import BaseLoader
+from langchain_core.documents import Document
+
+
+def _parse_html(html, url):
+    soup = BeautifulSoup(html, "html.parser")
+
+    metadata = {"source": url}
+    if soup.title and soup.title.string:
+        metadata["title"] = soup.title.string.strip()
+    description = soup.find("meta", attrs={"name": "description"})
+    if description and description.get("content"):
+        metadata["description"] = description["content"]
+    if soup.html and soup.html.get("lang"):
+        metadata["language"] = soup.html["lang"]
+
+    return soup.get_text(), metadata
+
+
+class HttpCache:
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _paths(self, url):
+        key = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.directory, key + ".json"), os.path.join(self.directory, key + ".body")
+
+    def get(self, url):
+        meta_path, body_path = self._paths(url)
+        if not (os.path.exists(meta_path) and os.path.exists(body_path)):
+            return None, None
+
+        with open(meta_path, "r") as f:
+            meta = json.load(f)
+        with open(body_path, "rb") as f:
+            body = f.read()
+        return meta, body
+
+    def put(self, url, headers, body):
+        meta_path, body_path = self._paths(url)
+        meta = {
+            "url": url,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+            "charset": headers.get("Content-Type", "").partition("charset=")[2] or None,
+        }
+
+        with open(body_path + ".tmp", "wb") as f:
+            f.write(body)
+        os.replace(body_path + ".tmp", body_path)
+        with open(meta_path, "w") as f:
+            json.dump(meta, f)
+
+
+class AsyncWebLoader(BaseLoader):
+    """WebBaseLoader replacement that fetches many URLs concurrently with conditional requests.
+
+    All requests share one keep-alive aiohttp connection pool, with at most
+    `per_host_limit` concurrent requests per host. Responses are cached on
+    disk with their ETag/Last-Modified, and later runs send conditional GETs
+    so unchanged pages come back as 304 without a body. HTML is parsed in a
+    process pool so BeautifulSoup never blocks the event loop.
+    """
+
+    def __init__(self, urls, cache_dir="http_cache", max_connections=100, per_host_limit=4,
+                 parse_workers=None, timeout=30):
+        self.urls = [urls] if isinstance(urls, str) else list(urls)
+        self.cache = HttpCache(cache_dir)
+        self.max_connections = max_connections
+        self.per_host_limit = per_host_limit
+        self.parse_workers = parse_workers
+        self.timeout = timeout
+        self.stats = {"fetched": 0, "not_modified": 0, "failed": 0}
+
+    async def _fetch(self, session, url):
+        meta, body = self.cache.get(url)
+
+        headers = {}
+        if meta:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        async with session.get(url, headers=headers) as response:
+            if response.status == 304 and body is not None:
+                self.stats["not_modified"] += 1
+                return body.decode(meta.get("charset") or "utf-8", errors="replace")
+
+            response.raise_for_status()
+            body = await response.read()
+            self.cache.put(url, response.headers, body)
+            self.stats["fetched"] += 1
+            return body.decode(response.charset or "utf-8", errors="replace")
+
+    async def alazy_load(self):
+        connector = aiohttp.TCPConnector(limit=self.max_connections, limit_per_host=self.per_host_limit)
+        timeout = aiohttp.ClientTimeout(total=self.timeout)
+        loop = asyncio.get_running_loop()
+
+        with ProcessPoolExecutor(max_workers=self.parse_workers) as pool:
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+
+                async def fetch_and_parse(url):
+                    html = await self._fetch(session, url)
+                    return await loop.run_in_executor(pool, _parse_html, html, url)
+
+                tasks = [asyncio.create_task(fetch_and_parse(url)) for url in self.urls]
+                for task in asyncio.as_completed(tasks):
+                    try:
+                        text, metadata = await task
+                    except (aiohttp.ClientError, asyncio.TimeoutError):
+                        self.stats["failed"] += 1
+                        continue
+                    yield Document(page_content=text, metadata=metadata)
+
+    async def aload(self):
+        return [doc async for doc in self.alazy_load()]
+
+    def load(self):
+        return asyncio.run(self.aload())
+
+    def lazy_load(self):
+        yield from self.load()
@@ -0,0 +1,115 @@
+import csv
+import operator
+from numbers import Number
+
+import pandas as pd
+from langchain_core.document_loaders import BaseLoader
+from langchain_core.documents import Document
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+except ImportError:
+    pa_csv = None
+
+OPERATORS = {
+    "==": operator.eq,
+    "!=": operator.ne,
+    ">": operator.gt,
+    ">=": operator.ge,
+    "<": operator.lt,
+    "<=": operator.le,
+    "in": lambda column, values: column.isin(values),
+}
+
+
+class ChunkedCSVLoader(BaseLoader):
+    """CSVLoader replacement that reads very large tables in fixed-size chunks.
+
+    Only `columns` (plus any filter columns) are read, rows are filtered per
+    chunk with `filters` such as [("expression", ">", 2.0)], and `page_content`
+    is built with vectorized string ops in the same "column: value" layout as
+    CSVLoader. Every column is read as text, so values appear exactly as in
+    the file; a filter column is converted to numbers only when compared with
+    a number, and values that do not parse (e.g. "below_detection") never
+    match and are counted in `stats["unparsed"]`. Documents are yielded
+    lazily, so memory stays flat. pyarrow's streaming reader is used when
+    installed, pandas chunks otherwise.
+    """
+
+    def __init__(self, file_path, columns=None, filters=None, chunk_size=100_000, encoding="utf-8"):
+        self.file_path = file_path
+        self.columns = columns
+        self.filters = filters or []
+        self.chunk_size = chunk_size
+        self.encoding = encoding
+        self.stats = {"unparsed": 0}
+
+    def _read_columns(self):
+        if self.columns is None:
+            return None
+        return list(dict.fromkeys(list(self.columns) + [column for column, _, _ in self.filters]))
+
+    def _chunks(self):
+        read_columns = self._read_columns()
+
+        if pa_csv is not None:
+            with open(self.file_path, newline="", encoding=self.encoding) as f:
+                header = next(csv.reader(f), [])
+            reader = pa_csv.open_csv(
+                self.file_path,
+                read_options=pa_csv.ReadOptions(block_size=1 << 24, encoding=self.encoding),
+                convert_options=pa_csv.ConvertOptions(
+                    include_columns=read_columns,
+                    column_types={column: pa.string() for column in header},
+                    strings_can_be_null=False,
+                    quoted_strings_can_be_null=False,
+                ),
+            )
+            for batch in reader:
+                frame = batch.to_pandas()
+                for start in range(0, len(frame), self.chunk_size):
+                    yield frame.iloc[start:start + self.chunk_size]
+        else:
+            yield from pd.read_csv(
+                self.file_path, usecols=read_columns, chunksize=self.chunk_size, encoding=self.encoding,
+                dtype=str, keep_default_na=False,
+            )
+
+    def _filter(self, frame):
+        if not self.filters:
+            return frame
+
+        mask = pd.Series(True, index=frame.index)
+        for column, op, value in self.filters:
+            mask &= OPERATORS[op](self._cast(frame[column], value), value)
+        return frame[mask]
+
+    def _cast(self, column, value):
+        values = value if isinstance(value, (list, tuple, set)) else [value]
+        if not all(isinstance(v, Number) and not isinstance(v, bool) for v in values):
+            return column
+
+        numbers = pd.to_numeric(column, errors="coerce")
+        self.stats["unparsed"] += int((numbers.isna() & (column.str.strip() != "")).sum())
+        return numbers
+
+    def lazy_load(self):
+        row_offset = 0
+
+        for frame in self._chunks():
+            frame = frame.set_axis(pd.RangeIndex(row_offset, row_offset + len(frame)))
+            row_offset += len(frame)
+
+            frame = self._filter(frame)
+            if frame.empty:
+                continue
+
+            columns = self.columns or list(frame.columns)
+            content = None
+            for column in columns:
+                part = column + ": " + frame[column].fillna("").astype(str)
+                content = part if content is None else content + "\n" + part
+
+            for row, page_content in zip(frame.index, content):
+                yield Document(page_content=page_content, metadata={"source": self.file_path, "row": int(row)})
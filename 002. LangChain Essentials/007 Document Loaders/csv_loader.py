@@ -1,8 +1,10 @@
-from langchain_community.document_loaders import CSVLoader
+from chunked_csv_loader import ChunkedCSVLoader
 
-loader = CSVLoader(file_path="gene_expression.csv")
+loader = ChunkedCSVLoader(file_path="gene_expression.csv", chunk_size=100_000)
 
-docs = loader.load()
+docs = loader.lazy_load()
 
-print(docs[0].page_content)
-print(docs[0].metadata)
\ No newline at end of file
+doc = next(docs)
+
+print(doc.page_content)
+print(doc.metadata)
\ No newline at end of file
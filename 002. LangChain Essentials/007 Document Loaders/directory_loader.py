@@ -1,14 +1,16 @@
-from langchain_community.document_loaders import PyPDFLoader, DirectoryLoader
+from langchain_community.document_loaders import PyPDFLoader
+from parallel_directory_loader import ParallelDirectoryLoader
 
 
-loader = DirectoryLoader(
-    path="books",
-    glob="*.pdf",
-    show_progress=True,
-    loader_cls=PyPDFLoader,
-)
+if __name__ == "__main__":
+    loader = ParallelDirectoryLoader(
+        path="books",
+        glob="*.pdf",
+        loader_cls=PyPDFLoader,
+        ordered=True,
+    )
 
-docs = loader.load()
+    docs = loader.lazy_load()
 
-print(docs[0].page_content)
-print(docs[1].metadata)
\ No newline at end of file
+    print(next(docs).page_content)
+    print(next(docs).metadata)
\ No newline at end of file
@@ -0,0 +1,70 @@
+import hashlib
+import shutil
+import tempfile
+import threading
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from async_web_loader import AsyncWebLoader
+
+PAGES = {
+    f"/page/{i}": f"<html lang='en'><head><title>Page {i}</title></head><body><p>Bioinformatics page {i}.</p></body></html>"
+    for i in range(20)
+}
+LAST_MODIFIED = formatdate(usegmt=True)
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        page = PAGES.get(self.path)
+        if page is None:
+            self.send_response(404)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+
+        etag = '"' + hashlib.md5(page.encode("utf-8")).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        body = page.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", LAST_MODIFIED)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+if __name__ == "__main__":
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    urls = [base_url + path for path in PAGES] + [base_url + "/missing"]
+    cache_dir = tempfile.mkdtemp()
+
+    try:
+        first = AsyncWebLoader(urls, cache_dir=cache_dir, parse_workers=2)
+        docs = first.load()
+        assert len(docs) == len(PAGES) and first.stats == {"fetched": 20, "not_modified": 0, "failed": 1}
+
+        second = AsyncWebLoader(urls, cache_dir=cache_dir, parse_workers=2)
+        cached_docs = second.load()
+        assert second.stats == {"fetched": 0, "not_modified": 20, "failed": 1}
+        assert sorted(d.page_content for d in docs) == sorted(d.page_content for d in cached_docs)
+        assert {d.metadata["title"] for d in docs} == {f"Page {i}" for i in range(20)}
+
+        print("first run:", first.stats)
+        print("second run:", second.stats)
+    finally:
+        server.shutdown()
+        shutil.rmtree(cache_dir)
@@ -0,0 +1,62 @@
+import os
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from pathlib import Path
+
+from langchain_community.document_loaders import PyPDFLoader
+from langchain_core.document_loaders import BaseLoader
+
+
+def _load_file(loader_cls, path, loader_kwargs):
+    return loader_cls(path, **loader_kwargs).load()
+
+
+class ParallelDirectoryLoader(BaseLoader):
+    """DirectoryLoader that parses files in a process pool and yields documents as they are ready.
+
+    At most `max_pending` files are in flight at once, so memory stays bounded
+    even when the consumer is slower than the parsers. With `ordered=True`
+    documents come out in sorted file order; otherwise each file's documents
+    are yielded as soon as that file finishes.
+    """
+
+    def __init__(self, path, glob="*.pdf", loader_cls=PyPDFLoader, loader_kwargs=None,
+                 max_workers=None, max_pending=None, ordered=True, recursive=False):
+        self.path = path
+        self.glob = glob
+        self.loader_cls = loader_cls
+        self.loader_kwargs = loader_kwargs or {}
+        self.max_workers = max_workers or os.cpu_count()
+        self.max_pending = max_pending or 2 * self.max_workers
+        self.ordered = ordered
+        self.recursive = recursive
+
+    def _files(self):
+        pattern = Path(self.path).rglob if self.recursive else Path(self.path).glob
+        return sorted(str(p) for p in pattern(self.glob) if p.is_file())
+
+    def lazy_load(self):
+        files = iter(self._files())
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            pending = deque()
+
+            def submit_next():
+                path = next(files, None)
+                if path is not None:
+                    pending.append(pool.submit(_load_file, self.loader_cls, path, self.loader_kwargs))
+
+            for _ in range(self.max_pending):
+                submit_next()
+
+            while pending:
+                if self.ordered:
+                    future = pending.popleft()
+                else:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    future = done.pop()
+                    pending.remove(future)
+
+                documents = future.result()
+                submit_next()
+                yield from documents
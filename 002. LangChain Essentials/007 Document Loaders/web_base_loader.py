@@ -1,7 +1,7 @@
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.output_parsers import StrOutputParser
 from langchain_core.prompts import PromptTemplate
-from langchain_community.document_loaders import WebBaseLoader
+from async_web_loader import AsyncWebLoader
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -15,14 +15,15 @@ prompt = PromptTemplate(
     input_variables=["question", "text"],
 )
 
-url = "https://www.bioinformatics.org/"
+chain = prompt | model | parser
 
-loader = WebBaseLoader(url)
+if __name__ == "__main__":
+    url = "https://www.bioinformatics.org/"
 
-docs = loader.load()
+    loader = AsyncWebLoader([url], cache_dir="http_cache", per_host_limit=4)
 
-chain = prompt | model | parser
+    docs = loader.load()
 
-result = chain.invoke({"question": "What is bioinformatics?", "text": docs[0].page_content})
+    result = chain.invoke({"question": "What is bioinformatics?", "text": docs[0].page_content})
 
-print(result)
\ No newline at end of file
+    print(result)
\ No newline at end of file
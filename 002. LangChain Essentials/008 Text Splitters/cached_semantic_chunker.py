@@ -0,0 +1,262 @@
+import hashlib
+import re
+import sqlite3
+from collections import deque
+
+import numpy as np
+from langchain_core.documents import BaseDocumentTransformer, Document
+
+BREAKPOINT_DEFAULTS = {
+    "percentile": 95,
+    "standard_deviation": 3,
+    "interquartile": 1.5,
+    "gradient": 95,
+}
+
+
+def breakpoint_threshold(distances, threshold_type, amount):
+    if threshold_type == "percentile":
+        return np.percentile(distances, amount), distances
+    if threshold_type == "standard_deviation":
+        return np.mean(distances) + amount * np.std(distances), distances
+    if threshold_type == "interquartile":
+        q1, q3 = np.percentile(distances, [25, 75])
+        return np.mean(distances) + amount * (q3 - q1), distances
+    if threshold_type == "gradient":
+        gradient = np.gradient(distances, range(len(distances))) if len(distances) > 1 else distances
+        return np.percentile(gradient, amount), gradient
+    raise ValueError(f"Unexpected breakpoint_threshold_type: {threshold_type}")
+
+
+def adjacent_distances(vectors):
+    vectors = vectors / np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+    return 1.0 - np.einsum("ij,ij->i", vectors[:-1], vectors[1:])
+
+
+class SentenceEmbeddingCache:
+    """Persistent sentence -> vector cache in SQLite.
+
+    Keys are SHA-256 hashes of (embedding model, text), so an unchanged
+    sentence window is never embedded twice, across runs included. Misses are
+    deduplicated and sent to the embeddings model in batches of `batch_size`.
+    """
+
+    def __init__(self, embeddings, path="sentence_embeddings.sqlite", batch_size=256):
+        self.embeddings = embeddings
+        self.batch_size = batch_size
+        model = getattr(embeddings, "model", None) or getattr(embeddings, "model_name", None)
+        self.namespace = f"{type(embeddings).__name__}:{model}"
+
+        self.db = sqlite3.connect(path)
+        self.db.execute("CREATE TABLE IF NOT EXISTS vectors (key TEXT PRIMARY KEY, vector BLOB)")
+        self.db.commit()
+        self.stats = {"hits": 0, "misses": 0}
+
+    def _key(self, text):
+        return hashlib.sha256(f"{self.namespace}\n{text}".encode("utf-8")).hexdigest()
+
+    def embed(self, texts):
+        keys = [self._key(text) for text in texts]
+        pending = dict(zip(keys, texts))
+        vectors = {}
+
+        unique = list(pending)
+        for start in range(0, len(unique), 500):
+            batch = unique[start:start + 500]
+            rows = self.db.execute(
+                f"SELECT key, vector FROM vectors WHERE key IN ({','.join('?' * len(batch))})", batch
+            ).fetchall()
+            for key, vector in rows:
+                vectors[key] = np.frombuffer(vector, dtype=np.float32)
+
+        missing = [key for key in unique if key not in vectors]
+        self.stats["hits"] += len(unique) - len(missing)
+        self.stats["misses"] += len(missing)
+
+        for start in range(0, len(missing), self.batch_size):
+            batch = missing[start:start + self.batch_size]
+            embedded = np.asarray(self.embeddings.embed_documents([pending[key] for key in batch]), dtype=np.float32)
+            self.db.executemany(
+                "INSERT OR REPLACE INTO vectors (key, vector) VALUES (?, ?)",
+                [(key, vector.tobytes()) for key, vector in zip(batch, embedded)],
+            )
+            self.db.commit()
+            vectors.update(zip(batch, embedded))
+
+        if not keys:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.stack([vectors[key] for key in keys])
+
+    def close(self):
+        self.db.close()
+
+
+class CachedSemanticChunker(BaseDocumentTransformer):
+    """SemanticChunker with batched, cached embeddings and a streaming mode.
+
+    Chunking follows SemanticChunker: sentences are combined with
+    `buffer_size` neighbours on each side, adjacent windows are compared by
+    cosine distance, and a chunk ends wherever the distance is above the
+    breakpoint threshold. Windows for all input texts are embedded in one
+    batched call through a SentenceEmbeddingCache, so after an edit only the
+    windows touching the changed sentences are embedded again, and distances
+    are one vectorized op. `stream_chunks` reads text incrementally and uses
+    the threshold over the last `window` distances, so memory stays bounded
+    for book-length inputs. Its first `min_samples` distances are held back
+    until that many have been seen (or the input ends), since a threshold
+    over one or two distances would never flag the first breakpoint.
+    """
+
+    def __init__(self, embeddings, cache_path="sentence_embeddings.sqlite", buffer_size=1,
+                 breakpoint_threshold_type="percentile", breakpoint_threshold_amount=None,
+                 sentence_split_regex=r"(?<=[.?!])\s+", min_chunk_size=None, batch_size=256):
+        if breakpoint_threshold_type not in BREAKPOINT_DEFAULTS:
+            raise ValueError(f"Unexpected breakpoint_threshold_type: {breakpoint_threshold_type}")
+        self.cache = SentenceEmbeddingCache(embeddings, cache_path, batch_size)
+        self.buffer_size = buffer_size
+        self.breakpoint_threshold_type = breakpoint_threshold_type
+        self.breakpoint_threshold_amount = (
+            BREAKPOINT_DEFAULTS[breakpoint_threshold_type] if breakpoint_threshold_amount is None
+            else breakpoint_threshold_amount
+        )
+        self.sentence_split = re.compile(sentence_split_regex)
+        self.min_chunk_size = min_chunk_size
+        self.batch_size = batch_size
+
+    def _windows(self, sentences):
+        b = self.buffer_size
+        return [" ".join(sentences[max(i - b, 0):i + b + 1]) for i in range(len(sentences))]
+
+    def _group(self, sentences, breakpoints):
+        chunks = []
+        start = 0
+        for index in breakpoints:
+            text = " ".join(sentences[start:index + 1])
+            if self.min_chunk_size is not None and len(text) < self.min_chunk_size:
+                continue
+            chunks.append(text)
+            start = index + 1
+        if start < len(sentences):
+            chunks.append(" ".join(sentences[start:]))
+        return chunks
+
+    def _needs_embedding(self, sentences):
+        return len(sentences) > (2 if self.breakpoint_threshold_type == "gradient" else 1)
+
+    def split_texts(self, texts):
+        sentence_lists = [self.sentence_split.split(text) for text in texts]
+        windows = [
+            window for sentences in sentence_lists if self._needs_embedding(sentences)
+            for window in self._windows(sentences)
+        ]
+        vectors = self.cache.embed(windows)
+
+        results = []
+        offset = 0
+        for sentences in sentence_lists:
+            if not self._needs_embedding(sentences):
+                results.append(sentences)
+                continue
+
+            embedded, offset = vectors[offset:offset + len(sentences)], offset + len(sentences)
+            threshold, scores = breakpoint_threshold(
+                adjacent_distances(embedded), self.breakpoint_threshold_type, self.breakpoint_threshold_amount
+            )
+            results.append(self._group(sentences, np.flatnonzero(scores > threshold).tolist()))
+        return results
+
+    def split_text(self, text):
+        return self.split_texts([text])[0]
+
+    def create_documents(self, texts, metadatas=None):
+        metadatas = metadatas or [{}] * len(texts)
+        return [
+            Document(page_content=chunk, metadata=dict(metadata))
+            for chunks, metadata in zip(self.split_texts(texts), metadatas)
+            for chunk in chunks
+        ]
+
+    def split_documents(self, documents):
+        documents = list(documents)
+        return self.create_documents([d.page_content for d in documents], [d.metadata for d in documents])
+
+    def transform_documents(self, documents, **kwargs):
+        return self.split_documents(documents)
+
+    def _stream_sentences(self, pieces):
+        carry = ""
+        for piece in pieces:
+            sentences = self.sentence_split.split(carry + piece)
+            carry = sentences.pop()
+            yield from sentences
+        if carry:
+            yield carry
+
+    def stream_chunks(self, pieces, window=256, min_samples=16):
+        if self.breakpoint_threshold_type == "gradient":
+            raise ValueError("stream_chunks does not support the gradient threshold")
+
+        b = self.buffer_size
+        min_samples = min(min_samples, window)
+        sentences = []
+        base = 0
+        embedded = 0
+        chunk_start = 0
+        previous = None
+        recent = deque(maxlen=window)
+        undecided = []
+
+        def decide():
+            nonlocal chunk_start
+            threshold, _ = breakpoint_threshold(
+                np.fromiter(recent, dtype=np.float64), self.breakpoint_threshold_type,
+                self.breakpoint_threshold_amount,
+            )
+            for index, distance in undecided:
+                if distance > threshold:
+                    text = " ".join(sentences[j - base] for j in range(chunk_start, index + 1))
+                    if self.min_chunk_size is None or len(text) >= self.min_chunk_size:
+                        yield text
+                        chunk_start = index + 1
+            undecided.clear()
+
+        def process(final):
+            nonlocal base, embedded, previous
+            ready = base + len(sentences) - (0 if final else b)
+            if ready <= embedded:
+                if final and undecided:
+                    yield from decide()
+                return
+
+            windows = [
+                " ".join(sentences[j - base] for j in range(max(i - b, 0), min(i + b + 1, base + len(sentences))))
+                for i in range(embedded, ready)
+            ]
+            vectors = self.cache.embed(windows)
+            if previous is not None:
+                vectors = np.vstack([previous, vectors])
+            previous = vectors[-1:]
+
+            first = embedded if embedded == 0 else embedded - 1
+            for offset, distance in enumerate(adjacent_distances(vectors)):
+                recent.append(distance)
+                undecided.append((first + offset, distance))
+                if len(recent) >= min_samples:
+                    yield from decide()
+            if final and undecided:
+                yield from decide()
+            embedded = ready
+
+            keep_from = min(chunk_start, embedded - b)
+            if keep_from > base:
+                del sentences[:keep_from - base]
+                base = keep_from
+
+        for sentence in self._stream_sentences(pieces):
+            sentences.append(sentence)
+            if base + len(sentences) - embedded >= self.batch_size + b:
+                yield from process(final=False)
+
+        yield from process(final=True)
+        if chunk_start < base + len(sentences):
+            yield " ".join(sentences[j - base] for j in range(chunk_start, base + len(sentences)))
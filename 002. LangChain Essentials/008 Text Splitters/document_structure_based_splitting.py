@@ -1,4 +1,5 @@
-from langchain.text_splitter import RecursiveCharacterTextSplitter
+from recursive_splitter import FastRecursiveCharacterTextSplitter
+from incremental_splitter import IncrementalSplitter
 
 code = """
 class Student:
@@ -51,20 +52,33 @@ A simple Python-based project to manage and track student data, including their
    git clone https://github.com/your-username/student-tracker.git
 """
 
-# splitter = RecursiveCharacterTextSplitter.from_language(
+# splitter = IncrementalSplitter(
+#     FastRecursiveCharacterTextSplitter.from_language(
+#         language="python",
+#         chunk_size=300,
+#         chunk_overlap=0,
+#     ),
 #     language="python",
-#     chunk_size=300,
-#     chunk_overlap=0,
 # )
 
-# chunks = splitter.split_text(code)
+# chunks = splitter.update("student.py", code)["documents"]
 
-splitter = RecursiveCharacterTextSplitter.from_language(
+splitter = IncrementalSplitter(
+    FastRecursiveCharacterTextSplitter.from_language(
+        language="markdown",
+        chunk_size=200,
+        chunk_overlap=0,
+    ),
     language="markdown",
-    chunk_size=200,
-    chunk_overlap=0,
 )
 
-chunks = splitter.split_text(markdown)
+chunks = splitter.update("README.md", markdown)["documents"]
 
-print("Number of chunks:", len(chunks))
\ No newline at end of file
+print("Number of chunks:", len(chunks))
+
+edited = markdown.replace("- View student details", "- View and edit student details")
+
+result = splitter.update("README.md", edited)
+
+print("Re-split regions:", result["stats"]["resplit"], "of", result["stats"]["regions"])
+print("Chunks to re-embed:", len(result["added"]), "| Chunks to delete:", len(result["removed"]))
\ No newline at end of file
@@ -0,0 +1,188 @@
+import hashlib
+import io
+import json
+import re
+import sqlite3
+import tokenize
+
+from langchain_core.documents import Document
+
+MARKDOWN_HEADING = re.compile(r"#{1,6} ")
+MARKDOWN_FENCE = re.compile(r" {0,3}(`{3,}|~{3,})")
+PYTHON_BLOCK_KEYWORDS = {"class", "def", "async"}
+PYTHON_CONTINUATIONS = {"else", "elif", "except", "finally"}
+
+
+def content_hash(text):
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+def _regions(text, lines, start_lines):
+    offsets = [0]
+    for line in lines:
+        offsets.append(offsets[-1] + len(line))
+    starts = [0] + [offsets[line - 1] for line in start_lines]
+    return [text[start:end] for start, end in zip(starts, starts[1:] + [len(text)])]
+
+
+def markdown_regions(text):
+    lines = text.splitlines(keepends=True)
+    start_lines = []
+    fence = None
+    has_content = False
+    for number, line in enumerate(lines, 1):
+        match = MARKDOWN_FENCE.match(line)
+        if fence is None and match:
+            fence = match.group(1)
+        elif fence is not None:
+            # A fence closes with the same character, at least as long, and nothing after it.
+            if match and match.group(1)[0] == fence[0] and len(match.group(1)) >= len(fence) \
+                    and not line[match.end():].strip():
+                fence = None
+        elif MARKDOWN_HEADING.match(line) and has_content:
+            start_lines.append(number)
+        has_content = has_content or bool(line.strip())
+    return _regions(text, lines, start_lines)
+
+
+def _top_level_statements(text):
+    """(first line, first token, opens an indented block, comment lines just above) per top-level statement."""
+    statements = []
+    comments = []
+    depth = 0
+    at_line_start = True
+    for token in tokenize.generate_tokens(io.StringIO(text).readline):
+        kind = token.type
+        if kind == tokenize.INDENT:
+            depth += 1
+            if depth == 1 and statements:
+                statements[-1][2] = True
+        elif kind == tokenize.DEDENT:
+            depth -= 1
+        elif kind == tokenize.NEWLINE:
+            at_line_start = True
+        elif kind == tokenize.NL:
+            if at_line_start and not token.line.strip():
+                comments = []
+        elif kind == tokenize.COMMENT:
+            # Checked before DEDENT: tokenize only emits it at the next statement.
+            if at_line_start and token.start[1] == 0:
+                comments.append(token.start[0])
+        elif at_line_start and kind != tokenize.ENDMARKER:
+            at_line_start = False
+            if depth == 0:
+                statements.append([token.start[0], token.string, False, comments])
+            comments = []
+    return statements
+
+
+def python_regions(text):
+    lines = io.StringIO(text).readlines()
+    try:
+        statements = _top_level_statements(text)
+    except (tokenize.TokenError, IndentationError, SyntaxError):
+        return [text]
+
+    start_lines = []
+    previous = None
+    for line, first, opens_block, comments in statements:
+        if previous is not None and first not in PYTHON_CONTINUATIONS:
+            block = (first in PYTHON_BLOCK_KEYWORDS or first == "@") and previous[1] != "@"
+            if block or previous[2]:
+                # Comments directly above a statement belong to it, not to the previous region.
+                start_lines.append(comments[0] if comments else line)
+        previous = (line, first, opens_block)
+    return _regions(text, lines, start_lines)
+
+
+REGION_SPLITTERS = {
+    "markdown": markdown_regions,
+    "python": python_regions,
+}
+
+
+class IncrementalSplitter:
+    """Re-splits only the structural regions of a document that changed since the last run.
+
+    A document is cut into regions (a markdown heading's section, ignoring
+    headings inside ``` and ~~~ fences, or in Python a top-level class/def
+    block together with the comments directly above it, found with
+    `tokenize` so strings and comments never start a region) and each
+    region is split on its own, so no chunk spans two regions. The
+    regions' content hashes and chunks are kept in SQLite: on `update`,
+    regions whose hash is already known reuse their stored chunks, and only
+    new or edited regions go through `splitter`. Chunk IDs are derived from
+    (doc_id, chunk text), so unchanged chunks keep their IDs and only the
+    `added` and `removed` chunks need to be re-embedded downstream.
+    """
+
+    def __init__(self, splitter, language="markdown", path="split_state.sqlite"):
+        self.splitter = splitter
+        self.regions = REGION_SPLITTERS.get(language, lambda text: [text])
+        self.db = sqlite3.connect(path)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS regions ("
+            "doc_id TEXT, position INTEGER, region_hash TEXT, chunks TEXT, PRIMARY KEY (doc_id, position))"
+        )
+        self.db.commit()
+
+    def _previous(self, doc_id):
+        rows = self.db.execute(
+            "SELECT region_hash, chunks FROM regions WHERE doc_id = ? ORDER BY position", (doc_id,)
+        ).fetchall()
+        return [(region_hash, json.loads(chunks)) for region_hash, chunks in rows]
+
+    def _chunk_ids(self, doc_id, chunks):
+        seen = {}
+        ids = []
+        for chunk in chunks:
+            digest = content_hash(f"{doc_id}\n{chunk}")[:32]
+            seen[digest] = seen.get(digest, -1) + 1
+            ids.append(f"{digest}-{seen[digest]}")
+        return ids
+
+    def update(self, doc_id, text, metadata=None):
+        previous = self._previous(doc_id)
+        known = {region_hash: chunks for region_hash, chunks in previous}
+        old_ids = set(self._chunk_ids(doc_id, [chunk for _, chunks in previous for chunk in chunks]))
+
+        regions = []
+        resplit = 0
+        for region in self.regions(text):
+            region_hash = content_hash(region)
+            chunks = known.get(region_hash)
+            if chunks is None:
+                chunks = self.splitter.split_text(region)
+                known[region_hash] = chunks
+                resplit += 1
+            regions.append((region_hash, chunks))
+
+        texts = [chunk for _, chunks in regions for chunk in chunks]
+        ids = self._chunk_ids(doc_id, texts)
+        documents = [
+            Document(id=chunk_id, page_content=chunk, metadata={**(metadata or {}), "doc_id": doc_id, "chunk_id": chunk_id})
+            for chunk_id, chunk in zip(ids, texts)
+        ]
+
+        self.db.execute("DELETE FROM regions WHERE doc_id = ?", (doc_id,))
+        self.db.executemany(
+            "INSERT INTO regions (doc_id, position, region_hash, chunks) VALUES (?, ?, ?, ?)",
+            [(doc_id, position, region_hash, json.dumps(chunks)) for position, (region_hash, chunks) in enumerate(regions)],
+        )
+        self.db.commit()
+
+        return {
+            "documents": documents,
+            "added": [d for d in documents if d.id not in old_ids],
+            "removed": sorted(old_ids - set(ids)),
+            "stats": {"regions": len(regions), "resplit": resplit, "chunks": len(documents)},
+        }
+
+    def delete(self, doc_id):
+        removed = self._chunk_ids(doc_id, [chunk for _, chunks in self._previous(doc_id) for chunk in chunks])
+        self.db.execute("DELETE FROM regions WHERE doc_id = ?", (doc_id,))
+        self.db.commit()
+        return removed
+
+    def close(self):
+        self.db.close()
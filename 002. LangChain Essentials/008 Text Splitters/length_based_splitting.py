@@ -1,11 +1,12 @@
-from langchain.text_splitter import CharacterTextSplitter
 from langchain_community.document_loaders import PyPDFLoader
 
+from span_splitter import SpanCharacterTextSplitter
+
 loader = PyPDFLoader("AI in Bioinformatics.pdf")
 
 docs = loader.load()
 
-splitter = CharacterTextSplitter(
+splitter = SpanCharacterTextSplitter(
     chunk_size=100,
     chunk_overlap=0,
     separator=""
@@ -13,4 +14,5 @@ splitter = CharacterTextSplitter(
 
 result = splitter.split_documents(docs)
 
-print("Number of chunks:", len(result))
\ No newline at end of file
+print("Number of chunks:", len(result))
+print("First chunk:", result.document(0))
\ No newline at end of file
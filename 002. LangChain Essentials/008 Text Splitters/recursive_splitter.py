@@ -0,0 +1,304 @@
+import math
+import logging
+import multiprocessing
+import os
+import pickle
+import re
+from bisect import bisect_left, bisect_right
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+REGEX_CHARS = set(".^$*+?{}[]\\|()")
+# Unescaped anchors, word boundaries and lookarounds: their result depends on
+# text outside the piece being split, so one index over the whole text can't
+# reproduce a per-piece re.split.
+CONTEXT_DEPENDENT = re.compile(r"(?<!\\)(?:\\\\)*(?:[\^$]|\\[bBAZ]|\(\?<?[=!])")
+VECTORIZE_ABOVE = 64
+
+logger = logging.getLogger(__name__)
+
+_splitter = None
+
+
+def _init_worker(splitter):
+    global _splitter
+    _splitter = splitter
+
+
+def _split_batch(texts, metadatas):
+    return _splitter.create_documents(texts, metadatas=metadatas)
+
+
+class BoundaryIndex:
+    """Every separator match in one text, found once and shared by all recursion levels.
+
+    Literal separators are located with vectorized comparisons over the text's
+    code points. Regex separators are found together in a single finditer pass
+    over a compiled alternation of lookaheads, which reports every separator
+    that matches at each position, overlapping ones included. Each level then
+    reads its split points for a span with a binary search.
+    """
+
+    def __init__(self, text, splitter):
+        self.text = text
+        self.splitter = splitter
+        self._codes = None
+        self._matches = {}
+
+    def _code_points(self):
+        if self._codes is None:
+            if self.text.isascii():
+                self._codes = np.frombuffer(self.text.encode("ascii"), dtype=np.uint8)
+            else:
+                self._codes = np.frombuffer(self.text.encode("utf-32-le", "surrogatepass"), dtype=np.uint32)
+        return self._codes
+
+    def _literal_matches(self, separator):
+        codes = self._code_points()
+        size = len(separator)
+        if len(codes) < size or (codes.dtype == np.uint8 and not separator.isascii()):
+            return np.empty(0, dtype=np.int64)
+
+        starts = np.flatnonzero(codes[:len(codes) - size + 1] == ord(separator[0]))
+        for offset in range(1, size):
+            starts = starts[codes[starts + offset] == ord(separator[offset])]
+        return starts.astype(np.int64)
+
+    def _scan_patterns(self):
+        splitter = self.splitter
+        found = {t: ([], []) for t in splitter._regex_levels}
+
+        for match in splitter._alternation.finditer(self.text):
+            for t, group in zip(splitter._regex_levels, splitter._regex_groups):
+                start = match.start(group)
+                if start != -1:
+                    found[t][0].append(start)
+                    found[t][1].append(match.end(group))
+
+        for t, (starts, ends) in found.items():
+            overlapping = any(start < end for start, end in zip(starts[1:], ends))
+            self._matches[t] = (starts, ends, overlapping)
+
+    def matches(self, level):
+        if level not in self._matches:
+            literal = self.splitter._literals[level]
+            if literal is not None:
+                starts = self._literal_matches(literal)
+                ends = starts + len(literal)
+                overlapping = bool(np.any(starts[1:] < ends[:-1]))
+                self._matches[level] = (starts.tolist(), ends.tolist(), overlapping)
+            else:
+                self._scan_patterns()
+        return self._matches[level]
+
+    def _local_end(self, level, start, end, limit):
+        if end <= limit:
+            return end
+        match = self.splitter._patterns[level].match(self.text, start, limit)
+        return None if match is None else match.end()
+
+    def has_match(self, level, a, b):
+        starts, ends, _ = self.matches(level)
+        for k in range(bisect_left(starts, a), bisect_left(starts, b)):
+            if self._local_end(level, starts[k], ends[k], b) is not None:
+                return True
+        return False
+
+    def split_points(self, level, a, b):
+        starts, ends, overlapping = self.matches(level)
+        lo = bisect_left(starts, a)
+        hi = bisect_left(starts, b, lo)
+        if not overlapping and (hi == lo or ends[hi - 1] <= b):
+            return starts[lo:hi], ends[lo:hi]
+
+        kept_starts, kept_ends = [], []
+        position = a
+        for k in range(lo, hi):
+            start = starts[k]
+            if start < position:
+                continue
+            end = self._local_end(level, start, ends[k], b)
+            if end is None:
+                continue
+            kept_starts.append(start)
+            kept_ends.append(end)
+            position = end if end > start else start + 1
+        return kept_starts, kept_ends
+
+
+class FastRecursiveCharacterTextSplitter(RecursiveCharacterTextSplitter):
+    """RecursiveCharacterTextSplitter that works on offsets over one boundary index per text.
+
+    Instead of re-searching and re-splitting every piece at every separator
+    level, all separator matches are found up front by a BoundaryIndex and
+    each level only slices it. Runs of small pieces are merged by binary
+    search over cumulative lengths rather than piece by piece, and chunk text
+    is sliced from the original string once. Chunks are identical to the
+    parent class's. Two cases are delegated to it: `keep_separator=False`,
+    which re-joins pieces with the separator, and regex separators with
+    anchors or lookarounds (e.g. latex's `$$`/`$`, visualbasic6's `(?!End)`),
+    which match differently inside a piece than in the whole text.
+    `split_documents` spreads large document lists across a process pool
+    that is started on first use and reused until `close()`; `processes=1`
+    keeps it in-process, as does a splitter that can't be pickled (e.g. a
+    `from_tiktoken_encoder` length function, which is a closure).
+    """
+
+    def __init__(self, separators=None, keep_separator=True, is_separator_regex=False,
+                 processes=None, parallel_threshold=256, **kwargs):
+        super().__init__(separators=separators, keep_separator=keep_separator,
+                         is_separator_regex=is_separator_regex, **kwargs)
+        self.processes = processes or os.cpu_count()
+        self.parallel_threshold = parallel_threshold
+        self._pool = None
+        self._picklable = None
+
+        self._patterns = [
+            re.compile(s if is_separator_regex else re.escape(s)) if s else None for s in self._separators
+        ]
+        self._literals = [
+            s if s and (not is_separator_regex or not set(s) & REGEX_CHARS) else None for s in self._separators
+        ]
+
+        self._context_dependent = is_separator_regex and any(CONTEXT_DEPENDENT.search(s) for s in self._separators)
+
+        self._regex_levels = [t for t, s in enumerate(self._separators) if s and self._literals[t] is None]
+        self._regex_groups = []
+        group = 1
+        for t in self._regex_levels:
+            self._regex_groups.append(group)
+            group += 1 + self._patterns[t].groups
+
+        self._alternation = None
+        if self._regex_levels:
+            sources = [self._patterns[t].pattern for t in self._regex_levels]
+            self._alternation = re.compile(
+                "(?=" + "|".join(f"(?:{s})" for s in sources) + ")" + "".join(f"(?:(?=({s}))|)" for s in sources)
+            )
+
+    def _cumulative_lengths(self, text, bounds):
+        if self._length_function is len:
+            return bounds
+        cumulative = [0]
+        for start, end in zip(bounds, bounds[1:]):
+            cumulative.append(cumulative[-1] + self._length_function(text[start:end]))
+        return cumulative
+
+    def _emit(self, text, start, end, chunks):
+        chunk = text[start:end]
+        if self._strip_whitespace:
+            chunk = chunk.strip()
+        if chunk:
+            chunks.append(chunk)
+
+    def _merge(self, text, bounds, cumulative, separator_len, i, m, chunks):
+        size, overlap = self._chunk_size, self._chunk_overlap
+
+        while True:
+            j = bisect_right(cumulative, cumulative[i] + size + separator_len, i, m + 1) - 1
+            self._emit(text, bounds[i], bounds[j], chunks)
+            if j >= m:
+                return
+            end = cumulative[j] - separator_len
+            threshold = max(end - overlap, min(cumulative[j + 1] - separator_len - size, end))
+            i = bisect_left(cumulative, threshold, i, j + 1)
+
+    def _split_span(self, text, index, a, b, level, chunks):
+        separators = self._separators
+        chosen, has_next = len(separators) - 1, False
+        for t in range(level, len(separators)):
+            if not separators[t]:
+                chosen = t
+                break
+            if index.has_match(t, a, b):
+                chosen, has_next = t, t + 1 < len(separators)
+                break
+
+        if not separators[chosen]:
+            bounds = list(range(a, b + 1))
+        else:
+            starts, ends = index.split_points(chosen, a, b)
+            cuts = ends if self._keep_separator == "end" else starts
+            # Empty pieces are dropped, as in _split_text_with_regex.
+            bounds = [a, *cuts[cuts[0] == a:]] if cuts else [a]
+            if bounds[-1] != b:
+                bounds.append(b)
+
+        pieces = len(bounds) - 1
+        cumulative = self._cumulative_lengths(text, bounds)
+        if pieces > VECTORIZE_ABOVE:
+            large = np.flatnonzero(np.diff(cumulative) >= self._chunk_size).tolist()
+        else:
+            large = [k for k in range(pieces) if cumulative[k + 1] - cumulative[k] >= self._chunk_size]
+
+        # _merge_splits counts the (empty) merge separator between pieces too.
+        separator_len = self._length_function("")
+        if separator_len:
+            cumulative = [c + t * separator_len for t, c in enumerate(cumulative)]
+
+        run_start = 0
+        for k in large:
+            if k > run_start:
+                self._merge(text, bounds, cumulative, separator_len, run_start, k, chunks)
+            if has_next:
+                self._split_span(text, index, bounds[k], bounds[k + 1], chosen + 1, chunks)
+            else:
+                chunks.append(text[bounds[k]:bounds[k + 1]])
+            run_start = k + 1
+        if run_start < pieces:
+            self._merge(text, bounds, cumulative, separator_len, run_start, pieces, chunks)
+
+    def split_text(self, text):
+        if not self._keep_separator or self._context_dependent:
+            return super().split_text(text)
+
+        if self._length_function is len and len(text) < self._chunk_size:
+            chunk = text.strip() if self._strip_whitespace else text
+            return [chunk] if chunk else []
+
+        chunks = []
+        self._split_span(text, BoundaryIndex(text, self), 0, len(text), 0, chunks)
+        return chunks
+
+    def __getstate__(self):
+        return {**self.__dict__, "_pool": None}
+
+    def _can_pickle(self):
+        if self._picklable is None:
+            try:
+                pickle.dumps(self)
+                self._picklable = True
+            except (pickle.PicklingError, AttributeError, TypeError):
+                logger.warning("%s can't be pickled; splitting documents in-process.", type(self).__name__)
+                self._picklable = False
+        return self._picklable
+
+    def split_documents(self, documents):
+        documents = list(documents)
+        if self.processes == 1 or len(documents) < self.parallel_threshold or not self._can_pickle():
+            return super().split_documents(documents)
+
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(
+                max_workers=self.processes,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self,),
+            )
+
+        batch_size = math.ceil(len(documents) / (4 * self.processes))
+        batches = [documents[i:i + batch_size] for i in range(0, len(documents), batch_size)]
+
+        results = self._pool.map(
+            _split_batch,
+            [[d.page_content for d in batch] for batch in batches],
+            [[d.metadata for d in batch] for batch in batches],
+        )
+        return [chunk for batch in results for chunk in batch]
+
+    def close(self):
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
@@ -0,0 +1,84 @@
+import logging
+import random
+import time
+
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+from langchain_core.documents import Document
+
+from recursive_splitter import FastRecursiveCharacterTextSplitter
+
+WORDS = ["genome", "protein", "sequence", "alignment", "model", "cell", "data", "bioinformatics", "a", "of", "the"]
+TARGET_SIZE = 10_000_000
+
+
+def sentence():
+    return " ".join(random.choices(WORDS, k=random.randint(20, 300)))
+
+
+def prose():
+    return "\n\n".join("\n".join(sentence() for _ in range(random.randint(1, 4))) for _ in range(100))
+
+
+def transcript():
+    return " ".join(random.choices(WORDS, k=60_000))
+
+
+def markdown():
+    return "\n".join(f"\n## Section {i}\n\n{sentence()}\n\n```\ncode()\n```\n\n- {sentence()}" for i in range(100))
+
+
+def corpus(make):
+    parts, size = [], 0
+    while size < TARGET_SIZE:
+        parts.append(make())
+        size += len(parts[-1])
+    return "".join(parts)
+
+
+def megabytes_per_second(split, text):
+    start = time.perf_counter()
+    chunks = split(text)
+    return len(text) / 2**20 / (time.perf_counter() - start), chunks
+
+
+if __name__ == "__main__":
+    logging.disable(logging.WARNING)
+    random.seed(0)
+
+    cases = [
+        ("prose, 200/0", corpus(prose), None, {"chunk_size": 200, "chunk_overlap": 0}),
+        ("transcript, 1000/200", corpus(transcript), None, {"chunk_size": 1000, "chunk_overlap": 200}),
+        ("markdown, 200/0", corpus(markdown), "markdown", {"chunk_size": 200, "chunk_overlap": 0}),
+    ]
+
+    for name, text, language, kwargs in cases:
+        if language is None:
+            baseline = RecursiveCharacterTextSplitter(**kwargs)
+            fast = FastRecursiveCharacterTextSplitter(processes=1, **kwargs)
+        else:
+            baseline = RecursiveCharacterTextSplitter.from_language(language, **kwargs)
+            fast = FastRecursiveCharacterTextSplitter.from_language(language, processes=1, **kwargs)
+
+        baseline_rate, expected = megabytes_per_second(baseline.split_text, text)
+        fast_rate, chunks = megabytes_per_second(fast.split_text, text)
+        assert chunks == expected
+
+        print(f"{name:>22} | RecursiveCharacterTextSplitter: {baseline_rate:7.1f} MB/s | "
+              f"single pass: {fast_rate:7.1f} MB/s | speedup: {fast_rate / baseline_rate:5.1f}x")
+
+    documents = [Document(page_content=prose(), metadata={"source": i}) for i in range(2_000)]
+    total = sum(len(d.page_content) for d in documents) / 2**20
+
+    start = time.perf_counter()
+    expected = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200).split_documents(documents)
+    baseline_rate = total / (time.perf_counter() - start)
+
+    fast = FastRecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200)
+    start = time.perf_counter()
+    chunks = fast.split_documents(documents)
+    pool_rate = total / (time.perf_counter() - start)
+    fast.close()
+    assert chunks == expected
+
+    print(f"{'split_documents x2000':>22} | RecursiveCharacterTextSplitter: {baseline_rate:7.1f} MB/s | "
+          f"process pool: {pool_rate:7.1f} MB/s | speedup: {pool_rate / baseline_rate:5.1f}x")
@@ -0,0 +1,110 @@
+import logging
+import random
+
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+from langchain_core.documents import Document
+
+from recursive_splitter import FastRecursiveCharacterTextSplitter
+
+TOKENS = ["\n", "\n\n", "\n\n\n", " ", "  ", "\t", "# ", "\n## ", "\n#### ", "```\n", "\n***\n", "\n---\n",
+          "class ", "\nclass ", "\ndef ", "\n\tdef ", "genome", "protein", "é", "数据", "x" * 15,
+          "\\item ", "\n\\item ", "$$", "$", "\n\\section{", "\nPublic Sub ", "\nEnd Sub", "\nIf "]
+LANGUAGES = [None, "markdown", "python", "latex", "visualbasic6"]
+
+GOLDEN = {
+    "text_structure": """Cancer is a group of diseases characterized by uncontrolled
+cell growth and the ability to invade or spread to other parts of the
+body. These abnormal cells can form tumors, disrupt normal bodily
+functions, and, if untreated, become life-threatening.
+
+There are many types of cancer, including breast, lung,
+liver, and colon cancer, each with distinct causes and symptoms.
+Risk factors include genetics, lifestyle choices, environmental
+exposures, and certain infections.""",
+    "python": """
+class Student:
+    def __init__(self, name, age, grade):
+        self.name = name
+        self.age = age
+
+    def is_passing(self):
+        return self.grade >= 6.0
+
+
+student1 = Student("Aarav", 20, 8.2)
+if student1.is_passing():
+    print("The student is passing.")
+""",
+    "markdown": """
+# Project Name: Smart Student Tracker
+
+A simple Python-based project to manage and track student data.
+
+
+## Features
+
+- Add new students with relevant info
+- Check if a student is passing
+
+***
+
+## Getting Started
+
+1. Clone the repo
+   ```bash
+   git clone https://github.com/your-username/student-tracker.git
+""",
+}
+
+
+def splitter_pair(language=None, **kwargs):
+    if language is None:
+        return RecursiveCharacterTextSplitter(**kwargs), FastRecursiveCharacterTextSplitter(processes=1, **kwargs)
+    return (RecursiveCharacterTextSplitter.from_language(language, **kwargs),
+            FastRecursiveCharacterTextSplitter.from_language(language, processes=1, **kwargs))
+
+
+if __name__ == "__main__":
+    logging.disable(logging.WARNING)
+    random.seed(0)
+    checked = 0
+
+    for text in GOLDEN.values():
+        for language in LANGUAGES:
+            for chunk_size, chunk_overlap in [(50, 0), (100, 20), (200, 0), (300, 0), (1000, 200)]:
+                for keep_separator in [True, "end"]:
+                    expected, fast = splitter_pair(language, chunk_size=chunk_size, chunk_overlap=chunk_overlap,
+                                                   keep_separator=keep_separator)
+                    assert fast.split_text(text) == expected.split_text(text), (language, chunk_size, chunk_overlap)
+                    checked += 1
+
+    for _ in range(5000):
+        text = "".join(random.choice(TOKENS) for _ in range(random.randint(0, 200)))
+        chunk_size = random.randint(1, 120)
+        kwargs = {
+            "chunk_size": chunk_size,
+            "chunk_overlap": random.randint(0, chunk_size - 1),
+            "keep_separator": random.choice([True, "start", "end"]),
+            "strip_whitespace": random.random() < 0.8,
+        }
+        if random.random() < 0.2:
+            kwargs["length_function"] = lambda s: len(s.split()) + 1
+        expected, fast = splitter_pair(random.choice(LANGUAGES), **kwargs)
+        assert fast.split_text(text) == expected.split_text(text), (kwargs, text)
+        checked += 1
+
+    # Regex anchors: "$" matches at the end of a piece, not only of the text.
+    expected, fast = splitter_pair("latex", chunk_size=8, chunk_overlap=0)
+    assert fast.split_text("\n\\item a\n\n") == expected.split_text("\n\\item a\n\n") == ["\\item a"]
+
+    documents = [
+        Document(page_content="".join(random.choice(TOKENS) for _ in range(300)), metadata={"source": i})
+        for i in range(400)
+    ]
+    expected, _ = splitter_pair(chunk_size=200, chunk_overlap=20)
+    parallel = FastRecursiveCharacterTextSplitter(chunk_size=200, chunk_overlap=20, processes=2, parallel_threshold=100)
+    assert parallel.split_documents(documents) == expected.split_documents(documents)
+    assert parallel.split_documents(documents) == expected.split_documents(documents)  # reuses the pool
+    parallel.close()
+
+    print(f"{checked} splitter configurations and a parallel split_documents run match RecursiveCharacterTextSplitter")
@@ -0,0 +1,60 @@
+import os
+import random
+import tempfile
+import time
+import tracemalloc
+
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from cached_semantic_chunker import CachedSemanticChunker
+
+NUM_SENTENCES = 20_000
+WORDS = ["genome", "protein", "sequence", "alignment", "model", "cell", "data", "bioinformatics"]
+
+random.seed(0)
+
+
+def sentence():
+    return " ".join(random.choices(WORDS, k=random.randint(5, 20))).capitalize() + random.choice([".", "?", "!"])
+
+
+def measure(run):
+    tracemalloc.start()
+    start = time.perf_counter()
+    result = run()
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, elapsed, peak
+
+
+sentences = [sentence() for _ in range(NUM_SENTENCES)]
+book = " ".join(sentences)
+edited = " ".join(sentences[:NUM_SENTENCES // 2] + ["An edited sentence about protein folding."] + sentences[NUM_SENTENCES // 2 + 1:])
+
+with tempfile.TemporaryDirectory() as directory:
+    cache_path = os.path.join(directory, "sentence_embeddings.sqlite")
+    embeddings = DeterministicFakeEmbedding(size=384)
+
+    chunker = CachedSemanticChunker(embeddings, cache_path=cache_path,
+                                    breakpoint_threshold_type="standard_deviation", breakpoint_threshold_amount=1)
+    chunks, cold, _ = measure(lambda: chunker.split_text(book))
+    print(f"cold split:       {cold:6.2f}s | {len(chunks):5d} chunks | embedded windows: {chunker.cache.stats['misses']}")
+
+    chunker.cache.stats = {"hits": 0, "misses": 0}
+    chunks, warm, _ = measure(lambda: chunker.split_text(edited))
+    print(f"after one edit:   {warm:6.2f}s | {len(chunks):5d} chunks | embedded windows: {chunker.cache.stats['misses']}")
+
+    streaming = CachedSemanticChunker(embeddings, cache_path=os.path.join(directory, "stream.sqlite"),
+                                      breakpoint_threshold_type="standard_deviation", breakpoint_threshold_amount=1)
+    pages = (book[i:i + 4096] for i in range(0, len(book), 4096))
+    chunks, elapsed, peak = measure(lambda: sum(1 for _ in streaming.stream_chunks(pages, window=512)))
+    print(f"streaming:        {elapsed:6.2f}s | {chunks:5d} chunks | peak memory: {peak / 2**20:6.1f} MiB")
+
+    whole = CachedSemanticChunker(embeddings, cache_path=os.path.join(directory, "whole.sqlite"),
+                                  breakpoint_threshold_type="standard_deviation", breakpoint_threshold_amount=1)
+    chunks, elapsed, peak = measure(lambda: whole.split_text(book))
+    print(f"whole document:   {elapsed:6.2f}s | {len(chunks):5d} chunks | peak memory: {peak / 2**20:6.1f} MiB")
+
+    for c in (chunker, streaming, whole):
+        c.cache.close()
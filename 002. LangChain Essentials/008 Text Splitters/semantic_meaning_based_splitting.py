@@ -1,10 +1,10 @@
-from langchain_experimental.text_splitter import SemanticChunker
 from langchain_openai.embeddings import OpenAIEmbeddings
 from dotenv import load_dotenv
+from cached_semantic_chunker import CachedSemanticChunker
 
 load_dotenv()
 
-text_splitter = SemanticChunker(
+text_splitter = CachedSemanticChunker(
     OpenAIEmbeddings(),
     breakpoint_threshold_type="standard_deviation",
     breakpoint_threshold_amount=1,
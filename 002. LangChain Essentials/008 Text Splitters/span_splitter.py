@@ -0,0 +1,132 @@
+from collections import deque
+from collections.abc import Sequence
+
+import numpy as np
+from langchain_core.documents import Document
+
+
+class SpanChunks(Sequence):
+    """Lazy view over chunks stored as (doc_id, start, end) rows of an int64 array.
+
+    Nothing is copied out of the source texts until a chunk is accessed:
+    indexing returns the chunk text, `document(i)` builds a Document with the
+    source metadata plus exact `start_index`/`end_index` offsets for citation.
+    """
+
+    def __init__(self, texts, spans, metadatas=None):
+        self.texts = texts
+        self.spans = spans
+        self.metadatas = metadatas
+
+    def __len__(self):
+        return len(self.spans)
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        doc_id, start, end = self.spans[i]
+        return self.texts[doc_id][start:end]
+
+    def document(self, i):
+        doc_id, start, end = (int(v) for v in self.spans[i])
+        metadata = dict(self.metadatas[doc_id]) if self.metadatas else {}
+        metadata.update(start_index=start, end_index=end)
+        return Document(page_content=self.texts[doc_id][start:end], metadata=metadata)
+
+    def iter_documents(self):
+        for i in range(len(self)):
+            yield self.document(i)
+
+    def to_documents(self):
+        return list(self.iter_documents())
+
+
+class SpanCharacterTextSplitter:
+    """CharacterTextSplitter that returns chunk offsets instead of chunk strings.
+
+    Each text is scanned once: with `separator=""` chunk boundaries are pure
+    arithmetic (windows of `chunk_size` stepping by `chunk_size - chunk_overlap`),
+    otherwise separators are located with `str.find` and pieces are merged
+    greedily by the same rules as CharacterTextSplitter. No regex is involved.
+    Chunks are returned as a SpanChunks view over the original strings, with
+    surrounding whitespace trimmed from the span like `strip_whitespace=True`.
+    With a non-empty separator a chunk spans the original text between its
+    first and last piece, so runs of repeated separators are kept verbatim
+    and count toward `chunk_size` (only a single piece longer than
+    `chunk_size` can exceed it, as in CharacterTextSplitter).
+    """
+
+    def __init__(self, chunk_size=4000, chunk_overlap=200, separator="\n\n", strip_whitespace=True):
+        if chunk_overlap >= chunk_size:
+            raise ValueError(f"Got a larger chunk overlap ({chunk_overlap}) than chunk size ({chunk_size}).")
+        self.chunk_size = chunk_size
+        self.chunk_overlap = chunk_overlap
+        self.separator = separator
+        self.strip_whitespace = strip_whitespace
+
+    def _windows(self, text):
+        if not text:
+            return
+        step = self.chunk_size - self.chunk_overlap
+        for start in range(0, max(len(text) - self.chunk_size, 0) + step, step):
+            yield start, min(start + self.chunk_size, len(text))
+            if start + self.chunk_size >= len(text):
+                break
+
+    def _pieces(self, text):
+        sep, sep_len = self.separator, len(self.separator)
+        start = 0
+        while True:
+            end = text.find(sep, start)
+            if end == -1:
+                if start < len(text):
+                    yield start, len(text)
+                return
+            if end > start:
+                yield start, end
+            start = end + sep_len
+
+    def _merged(self, text):
+        # The size of a chunk is its span, gaps between pieces included; with
+        # single separators this is CharacterTextSplitter's piece + separator sum.
+        current = deque()
+
+        for start, end in self._pieces(text):
+            if current and end - current[0][0] > self.chunk_size:
+                yield current[0][0], current[-1][1]
+                while current and (current[-1][1] - current[0][0] > self.chunk_overlap
+                                   or end - current[0][0] > self.chunk_size):
+                    current.popleft()
+            current.append((start, end))
+
+        if current:
+            yield current[0][0], current[-1][1]
+
+    def _strip(self, text, start, end):
+        while start < end and text[start].isspace():
+            start += 1
+        while end > start and text[end - 1].isspace():
+            end -= 1
+        return start, end
+
+    def span_iter(self, texts):
+        for doc_id, text in enumerate(texts):
+            bounds = self._windows(text) if self.separator == "" else self._merged(text)
+            for start, end in bounds:
+                if self.strip_whitespace:
+                    start, end = self._strip(text, start, end)
+                if end > start:
+                    yield doc_id, start, end
+
+    def split_spans(self, texts, metadatas=None):
+        spans = np.fromiter(
+            (v for span in self.span_iter(texts) for v in span), dtype=np.int64
+        ).reshape(-1, 3)
+        return SpanChunks(texts, spans, metadatas)
+
+    def split_text(self, text):
+        return self.split_spans([text])
+
+    def split_documents(self, documents):
+        documents = list(documents)
+        return self.split_spans([d.page_content for d in documents], [d.metadata for d in documents])
@@ -0,0 +1,41 @@
+import random
+import time
+import tracemalloc
+
+from langchain.text_splitter import CharacterTextSplitter
+
+from span_splitter import SpanCharacterTextSplitter
+
+CORPUS_SIZES = [1_000_000, 10_000_000]
+WORDS = ["genome", "protein", "sequence", "alignment", "model", "cell", "data", "bioinformatics"]
+
+random.seed(0)
+
+
+def measure(split, text):
+    tracemalloc.start()
+    start = time.perf_counter()
+    chunks = split(text)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return chunks, elapsed, peak
+
+
+for size in CORPUS_SIZES:
+    text = ""
+    while len(text) < size:
+        text += " ".join(random.choices(WORDS, k=20_000)) + "\n\n"
+    text = text[:size]
+
+    baseline = CharacterTextSplitter(chunk_size=100, chunk_overlap=0, separator="")
+    spans = SpanCharacterTextSplitter(chunk_size=100, chunk_overlap=0, separator="")
+
+    expected, baseline_time, baseline_peak = measure(baseline.split_text, text)
+    chunks, span_time, span_peak = measure(spans.split_text, text)
+
+    assert list(chunks) == expected
+
+    print(f"{size:>11} chars | CharacterTextSplitter: {baseline_time:7.3f}s {baseline_peak / 2**20:8.1f} MiB | "
+          f"spans: {span_time:7.3f}s {span_peak / 2**20:6.1f} MiB | "
+          f"speedup: {baseline_time / span_time:5.1f}x | memory: {baseline_peak / span_peak:5.1f}x less")
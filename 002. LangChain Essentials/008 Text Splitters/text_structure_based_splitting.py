@@ -1,4 +1,4 @@
-from langchain.text_splitter import RecursiveCharacterTextSplitter
+from recursive_splitter import FastRecursiveCharacterTextSplitter
 
 text = """Cancer is a group of diseases characterized by uncontrolled 
 cell growth and the ability to invade or spread to other parts of the 
@@ -15,7 +15,7 @@ and quality of life for patients. Advances in medical research continue
 to offer new therapies, from targeted treatments to immunotherapy, 
 bringing hope to millions worldwide."""
 
-splitter = RecursiveCharacterTextSplitter(
+splitter = FastRecursiveCharacterTextSplitter(
     chunk_size=200,
     chunk_overlap=0,
 )
@@ -0,0 +1,27 @@
+from token_splitter import TokenRecursiveTextSplitter
+
+text = """Cancer is a group of diseases characterized by uncontrolled 
+cell growth and the ability to invade or spread to other parts of the 
+body. These abnormal cells can form tumors, disrupt normal bodily 
+functions, and, if untreated, become life-threatening.
+
+There are many types of cancer, including breast, lung, 
+liver, and colon cancer, each with distinct causes and symptoms.
+Risk factors include genetics, lifestyle choices, environmental 
+exposures, and certain infections.
+
+Early detection and treatment significantly improve survival rates 
+and quality of life for patients. Advances in medical research continue 
+to offer new therapies, from targeted treatments to immunotherapy, 
+bringing hope to millions worldwide."""
+
+splitter = TokenRecursiveTextSplitter(
+    encoding_name="cl100k_base",
+    chunk_size=50,
+    chunk_overlap=10,
+)
+
+chunks = splitter.split_text(text)
+
+print("Number of chunks:", len(chunks))
+print("Tokens per chunk:", [splitter.token_counter(chunk) for chunk in chunks])
\ No newline at end of file
@@ -0,0 +1,101 @@
+from collections import OrderedDict
+from itertools import accumulate
+
+import tiktoken
+
+from recursive_splitter import FastRecursiveCharacterTextSplitter
+
+
+class TokenCounter:
+    """Memoized tiktoken token counts per text segment.
+
+    Counts are kept in an LRU of up to `max_entries` segments, so pieces that
+    recur across recursion levels or documents (words, lines, boilerplate)
+    are tokenized once. `count_many` tokenizes all uncached segments with
+    tiktoken's batch encoder, which runs on `num_threads` threads outside the
+    GIL. Special tokens are counted as ordinary text.
+    """
+
+    def __init__(self, encoding_name="cl100k_base", model_name=None, max_entries=100_000,
+                 num_threads=8, batch_threshold=32):
+        self.encoding_name = tiktoken.encoding_for_model(model_name).name if model_name else encoding_name
+        self.encoding = tiktoken.get_encoding(self.encoding_name)
+        self.max_entries = max_entries
+        self.num_threads = num_threads
+        self.batch_threshold = batch_threshold
+        self.cache = OrderedDict()
+        self.stats = {"hits": 0, "misses": 0}
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["encoding"] = None
+        state["cache"] = OrderedDict()
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.encoding = tiktoken.get_encoding(self.encoding_name)
+
+    def _remember(self, text, count):
+        self.cache[text] = count
+        if len(self.cache) > self.max_entries:
+            self.cache.popitem(last=False)
+
+    def __call__(self, text):
+        count = self.cache.get(text)
+        if count is not None:
+            self.cache.move_to_end(text)
+            self.stats["hits"] += 1
+            return count
+
+        self.stats["misses"] += 1
+        count = len(self.encoding.encode_ordinary(text))
+        self._remember(text, count)
+        return count
+
+    def count_many(self, texts):
+        counts = [None] * len(texts)
+        missing = {}
+        for i, text in enumerate(texts):
+            count = self.cache.get(text)
+            if count is None:
+                missing.setdefault(text, []).append(i)
+            else:
+                self.cache.move_to_end(text)
+                counts[i] = count
+
+        self.stats["hits"] += len(texts) - sum(len(positions) for positions in missing.values())
+        self.stats["misses"] += len(missing)
+
+        if missing:
+            unique = list(missing)
+            if len(unique) >= self.batch_threshold:
+                tokens = self.encoding.encode_ordinary_batch(unique, num_threads=self.num_threads)
+            else:
+                tokens = [self.encoding.encode_ordinary(text) for text in unique]
+
+            for text, encoded in zip(unique, tokens):
+                self._remember(text, len(encoded))
+                for i in missing[text]:
+                    counts[i] = len(encoded)
+        return counts
+
+
+class TokenRecursiveTextSplitter(FastRecursiveCharacterTextSplitter):
+    """Recursive splitter whose `chunk_size` and `chunk_overlap` are measured in tokens.
+
+    Uses the same boundary engine as FastRecursiveCharacterTextSplitter, with
+    a TokenCounter as the length function: every piece at a recursion level
+    is counted in one batched, memoized call, and the greedy merge runs on
+    cumulative token counts, so no segment is tokenized twice. Chunks match
+    RecursiveCharacterTextSplitter.from_tiktoken_encoder with the same
+    encoding. Works with `from_language` as well.
+    """
+
+    def __init__(self, encoding_name="cl100k_base", model_name=None, num_threads=8, token_counter=None, **kwargs):
+        self.token_counter = token_counter or TokenCounter(encoding_name, model_name, num_threads=num_threads)
+        super().__init__(length_function=self.token_counter, **kwargs)
+
+    def _cumulative_lengths(self, text, bounds):
+        counts = self.token_counter.count_many([text[start:end] for start, end in zip(bounds, bounds[1:])])
+        return [0, *accumulate(counts)]
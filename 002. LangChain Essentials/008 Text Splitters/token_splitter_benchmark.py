@@ -0,0 +1,50 @@
+import logging
+import random
+import time
+
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+
+from token_splitter import TokenRecursiveTextSplitter
+
+NUM_DOCUMENTS = 200
+WORDS = ["genome", "protein", "sequence", "alignment", "model", "cell", "data", "bioinformatics", "a", "of", "the"]
+
+
+def document():
+    paragraphs = (" ".join(random.choices(WORDS, k=random.randint(20, 400))) + "." for _ in range(20))
+    return "\n\n".join(paragraphs)
+
+
+def timed(split, texts):
+    start = time.perf_counter()
+    chunks = [split(text) for text in texts]
+    return chunks, time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    logging.disable(logging.WARNING)
+    random.seed(0)
+    texts = [document() for _ in range(NUM_DOCUMENTS)]
+
+    baseline = RecursiveCharacterTextSplitter.from_tiktoken_encoder(
+        encoding_name="cl100k_base", chunk_size=256, chunk_overlap=32
+    )
+    splitter = TokenRecursiveTextSplitter(encoding_name="cl100k_base", chunk_size=256, chunk_overlap=32, processes=1)
+
+    expected, baseline_time = timed(baseline.split_text, texts)
+    chunks, cold_time = timed(splitter.split_text, texts)
+    assert chunks == expected
+    cold_stats = dict(splitter.token_counter.stats)
+
+    splitter.token_counter.stats = {"hits": 0, "misses": 0}
+    _, warm_time = timed(splitter.split_text, texts)
+    warm_stats = dict(splitter.token_counter.stats)
+
+    encoding = splitter.token_counter.encoding
+    sizes = [len(encoding.encode_ordinary(chunk)) for doc_chunks in chunks for chunk in doc_chunks]
+    print(f"from_tiktoken_encoder: {baseline_time:6.2f}s")
+    print(f"token splitter (cold): {cold_time:6.2f}s | speedup: {baseline_time / cold_time:5.1f}x | "
+          f"tokenized segments: {cold_stats['misses']} of {cold_stats['hits'] + cold_stats['misses']}")
+    print(f"token splitter (warm): {warm_time:6.2f}s | speedup: {baseline_time / warm_time:5.1f}x | "
+          f"tokenized segments: {warm_stats['misses']}")
+    print(f"chunk sizes: max {max(sizes)} tokens, mean {sum(sizes) / len(sizes):.0f} tokens (chunk_size=256)")
@@ -0,0 +1,32 @@
+from langchain_openai import OpenAIEmbeddings
+from langchain.vectorstores import Chroma
+from langchain.text_splitter import RecursiveCharacterTextSplitter
+from langchain_community.document_loaders import PyPDFLoader, TextLoader
+from dotenv import load_dotenv
+from ingestion_manifest import IngestionManifest
+
+load_dotenv()
+
+splitter = RecursiveCharacterTextSplitter(chunk_size=1000, chunk_overlap=200)
+
+def load_and_split(path):
+    if path.endswith(".pdf"):
+        loader = PyPDFLoader(path)
+    else:
+        loader = TextLoader(path, encoding="utf-8")
+    return splitter.split_documents(loader.load())
+
+
+vector_store = Chroma(
+    embedding_function=OpenAIEmbeddings(),
+    persist_directory='my_chroma_db',
+    collection_name='documents'
+)
+
+manifest = IngestionManifest("ingestion_manifest.sqlite")
+
+changes = manifest.sync("documents", vector_store, load_and_split, glob="**/*.*")
+
+manifest.close()
+
+print(changes)
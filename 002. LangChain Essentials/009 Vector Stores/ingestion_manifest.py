@@ -0,0 +1,113 @@
+import hashlib
+import os
+import sqlite3
+from pathlib import Path
+
+
+def file_hash(path, block_size=1 << 20):
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(block_size), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def chunk_ids(path, content_hash, count):
+    prefix = hashlib.sha256(f"{path}:{content_hash}".encode("utf-8")).hexdigest()[:32]
+    return [f"{prefix}-{i}" for i in range(count)]
+
+
+class IngestionManifest:
+    """Tracks (path, size, mtime, content hash) -> chunk IDs for incremental ingestion.
+
+    `diff` stats every file and only hashes those whose size or mtime changed,
+    so unchanged trees are checked without reading file contents. `sync` then
+    loads, splits and upserts only added or modified files and deletes the
+    chunks of modified and removed files from the vector store. Each file is
+    handled on its own: new chunks are added before the old ones are deleted
+    and the manifest is updated last, so a failure part-way through never
+    leaves a file with no chunks in the store.
+    """
+
+    def __init__(self, path="ingestion_manifest.sqlite"):
+        self.db = sqlite3.connect(path)
+        self.db.execute(
+            "CREATE TABLE IF NOT EXISTS files ("
+            "path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, content_hash TEXT, chunk_ids TEXT)"
+        )
+        self.db.commit()
+
+    def _entries(self):
+        rows = self.db.execute("SELECT path, size, mtime_ns, content_hash, chunk_ids FROM files").fetchall()
+        return {
+            path: {"size": size, "mtime_ns": mtime_ns, "content_hash": content_hash, "chunk_ids": ids.split(",") if ids else []}
+            for path, size, mtime_ns, content_hash, ids in rows
+        }
+
+    def diff(self, root, glob="**/*"):
+        entries = self._entries()
+        added, modified, unchanged = [], [], []
+        seen = set()
+
+        for file_path in sorted(Path(root).glob(glob)):
+            if not file_path.is_file():
+                continue
+
+            path = str(file_path)
+            seen.add(path)
+            stat = os.stat(path)
+            entry = entries.get(path)
+
+            if entry and entry["size"] == stat.st_size and entry["mtime_ns"] == stat.st_mtime_ns:
+                unchanged.append(path)
+                continue
+
+            content_hash = file_hash(path)
+            change = {"path": path, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "content_hash": content_hash}
+
+            if entry is None:
+                added.append(change)
+            elif entry["content_hash"] == content_hash:
+                self._record(change, entry["chunk_ids"])
+                unchanged.append(path)
+            else:
+                modified.append({**change, "old_chunk_ids": entry["chunk_ids"]})
+
+        deleted = [{"path": path, "old_chunk_ids": entry["chunk_ids"]} for path, entry in entries.items() if path not in seen]
+        self.db.commit()
+
+        return {"added": added, "modified": modified, "deleted": deleted, "unchanged": unchanged}
+
+    def _record(self, change, ids):
+        self.db.execute(
+            "INSERT OR REPLACE INTO files (path, size, mtime_ns, content_hash, chunk_ids) VALUES (?, ?, ?, ?, ?)",
+            (change["path"], change["size"], change["mtime_ns"], change["content_hash"], ",".join(ids)),
+        )
+
+    def sync(self, root, vector_store, load_and_split, glob="**/*"):
+        changes = self.diff(root, glob)
+
+        for change in changes["added"] + changes["modified"]:
+            chunks = load_and_split(change["path"])
+            ids = chunk_ids(change["path"], change["content_hash"], len(chunks))
+            if chunks:
+                vector_store.add_documents(chunks, ids=ids)
+
+            new_ids = set(ids)
+            stale_ids = [i for i in change.get("old_chunk_ids", []) if i not in new_ids]
+            if stale_ids:
+                vector_store.delete(ids=stale_ids)
+
+            self._record(change, ids)
+            self.db.commit()
+
+        for change in changes["deleted"]:
+            if change["old_chunk_ids"]:
+                vector_store.delete(ids=change["old_chunk_ids"])
+            self.db.execute("DELETE FROM files WHERE path = ?", (change["path"],))
+            self.db.commit()
+
+        return {kind: len(items) for kind, items in changes.items()}
+
+    def close(self):
+        self.db.close()